@@ -9,19 +9,178 @@ This script recursively initializes AI documentation for a project by:
 """
 
 import argparse
+import fnmatch
+import json
 import os
+import queue
+import re
+import shlex
+import stat
 import subprocess
 import sys
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+# Prefer orjson for parsing Claude's stream-json output when it is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+
+# Per-directory line counts are cached here between runs, keyed by relative path
+LINE_COUNT_CACHE_FILE = ".ai-docs-cache.json"
+LINE_COUNT_CACHE_VERSION = 1
+
+# Thread count for filesystem scanning and line counting, using the same
+# heuristic as ThreadPoolExecutor's default for I/O bound work
+DEFAULT_IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Seconds to wait for `claude --version` when checking the install
+CLAUDE_VERSION_TIMEOUT = 10
+
+# Descriptors Python opens are non-inheritable (PEP 446, Python 3.4+), so on Linux
+# there is nothing to close in the child. Skipping the sweep saves work on every
+# spawn, and close_fds=False is also what lets subprocess take its posix_spawn
+# fast path (Python 3.8+). This does not depend on the Python version
+CLOSE_FDS = sys.platform != "linux"
+
+# Path components that mark a directory as important, in priority order
+IMPORTANT_KEYWORDS = {
+    'src': 20, 'lib': 20, 'core': 25, 'api': 20,
+    'service': 15, 'model': 15, 'controller': 15,
+    'handler': 15, 'manager': 15, 'util': 5, 'utils': 5,
+    'helper': 5, 'common': 10, 'shared': 10,
+    'main': 20, 'app': 20, 'server': 20, 'client': 20
+}
+# The first listed keyword wins when a path contains several
+IMPORTANT_KEYWORD_PRIORITY = {keyword: i for i, keyword in enumerate(IMPORTANT_KEYWORDS)}
+
+# Substrings that mark test or example code
+NEGATIVE_PATTERN = re.compile('test|mock|example|demo|sample')
+
+
+# Starter rule files written to .cursor/rules/ when they don't already exist
+RULE_TEMPLATES = {
+    "project_architecture.mdc": """# Project Architecture
+
+This file contains project-specific architecture guidelines and patterns.
+
+## Overview
+- Project structure and organization
+- Module dependencies and relationships
+- Key architectural decisions
+
+## Guidelines
+- Follow established patterns in the codebase
+- Maintain consistency with existing architecture
+- Document significant architectural changes
+
+_This file will be auto-generated and customized by Claude AI._
+""",
+    "code_standards.mdc": """# Code Standards
+
+This file defines coding standards and conventions for this project.
+
+## Code Style
+- Follow language-specific best practices
+- Maintain consistency with existing code
+- Use meaningful names for variables and functions
+
+## Documentation
+- Document public APIs and interfaces
+- Include examples where helpful
+- Keep documentation up to date
+
+_This file will be auto-generated and customized by Claude AI._
+""",
+    "development_workflow.mdc": """# Development Workflow
+
+This file outlines the development workflow and processes for this project.
+
+## Workflow
+- Feature branch development
+- Code review requirements
+- Testing standards
+
+## Tools and Processes
+- Build and deployment procedures
+- Quality assurance practices
+- Change management
+
+_This file will be auto-generated and customized by Claude AI._
+"""
+}
+
+
+def count_file_lines(file_path: str) -> int:
+    """Count lines in a single file, returning 0 if it can't be read."""
+    total_lines = 0
+    try:
+        # Count newline bytes rather than decoding. The file is read unbuffered in
+        # large chunks, so each chunk is one read() straight into a fresh bytes object
+        with open(file_path, 'rb', buffering=0) as f:
+            read = f.read
+            last_chunk = b''
+            while True:
+                chunk = read(1 << 20)
+                if not chunk:
+                    break
+                total_lines += chunk.count(b'\n')
+                last_chunk = chunk
+            # Count a final line without a trailing newline
+            if last_chunk and not last_chunk.endswith(b'\n'):
+                total_lines += 1
+    except Exception:
+        # Skip files that can't be read
+        return 0
+    return total_lines
+
+
+def format_kb(num_bytes: int) -> str:
+    """Format a byte count as kilobytes for display."""
+    return f"{num_bytes / 1024:,.1f} KB"
+
+
+def enqueue_lines(stream, line_queue: queue.Queue):
+    """Push each line from a stream onto a queue, followed by None at end of stream."""
+    try:
+        for line in stream:
+            line_queue.put(line)
+    finally:
+        line_queue.put(None)
+
+
+def collect_stream(stream, chunks: list):
+    """Read a stream to the end, appending what was read to chunks."""
+    chunks.append(stream.read())
+
+
+@dataclass(frozen=True)
+class ComponentDir:
+    """A component directory with path details precomputed at discovery time."""
+    __slots__ = ("path", "rel_path", "rel_parts", "rel_project_root", "depth")
+    
+    path: Path
+    rel_path: str
+    rel_parts: Tuple[str, ...]
+    rel_project_root: str  # Path from the component back up to the project root
+    depth: int
 
 
 class TaskStats:
     """Track statistics for a single task."""
     
+    __slots__ = ('name', 'start_time', 'end_time', 'cost_usd', 'input_tokens', 'output_tokens',
+                 'duration_ms', 'success')
+    
     def __init__(self, name: str):
         self.name = name
         self.start_time = time.time()
@@ -49,158 +208,275 @@ class TaskStats:
         return time.time() - self.start_time
 
 
+# Serializes terminal output from concurrent spinners and the main thread so
+# frames from different components are never interleaved
+output_lock = threading.Lock()
+
+
+def write_output(text: str):
+    """Write text to stdout and flush it while holding the output lock."""
+    with output_lock:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def clear_lines(count: int) -> str:
+    """Return the escape sequence that moves up count lines and erases to the end of the screen."""
+    # A count of 0 would still move the cursor up one line on most terminals
+    return f"\033[{count}A\033[J" if count > 0 else ""
+
+
+class SpinnerRenderer:
+    """Draws every active progress spinner from a single background thread.
+    
+    Parallel components share one live region at the bottom of the terminal
+    instead of each running its own animation thread.
+    """
+    
+    def __init__(self):
+        self.active: List["ProgressSpinner"] = []
+        self.status: Optional[str] = None  # Footer line drawn below the spinners
+        self.thread = None
+        self.dirty = False
+        self.drawn: List[str] = []  # Lines drawn by the last frame
+        self.cv = threading.Condition()
+    
+    def register(self, spinner: "ProgressSpinner"):
+        """Start drawing a spinner, starting the render thread if it isn't running."""
+        with self.cv:
+            if not self.active:
+                # Hide cursor while spinners are shown
+                write_output("\033[?25l")
+            self.active.append(spinner)
+            self.dirty = True
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._render)
+                self.thread.daemon = True
+                self.thread.start()
+            else:
+                self.cv.notify()
+    
+    def unregister(self, spinner: "ProgressSpinner", text: str):
+        """Stop drawing a spinner, writing its final text above the remaining spinners."""
+        with self.cv:
+            self.active.remove(spinner)
+            # Restore cursor once the last spinner is gone
+            self.write_above(text if self.active else text + "\033[?25h")
+    
+    def write_above(self, text: str):
+        """Write text above the live region, which is redrawn below it on the next frame."""
+        with self.cv:
+            write_output(clear_lines(len(self.drawn)) + text)
+            self.drawn = []
+            self.dirty = True
+            self.cv.notify()
+    
+    def set_status(self, status: Optional[str]):
+        """Set the footer line. It is picked up by the next animation frame, so updating it is cheap."""
+        with self.cv:
+            self.status = status
+    
+    def notify(self):
+        """Wake the render thread so new messages are drawn right away."""
+        with self.cv:
+            self.dirty = True
+            self.cv.notify()
+    
+    def _render(self):
+        """Render all active spinners until none are left."""
+        next_frame = time.time()
+        
+        with self.cv:
+            try:
+                while self.active:
+                    # Sleep until the next animation frame is due, waking early for new messages or changes
+                    self.cv.wait_for(lambda: self.dirty or not self.active, timeout=max(0.0, next_frame - time.time()))
+                    if not self.active:
+                        break
+                    self.dirty = False
+                
+                    # Only advance the animation on its own cadence, not on every message
+                    now = time.time()
+                    advance = now >= next_frame
+                    if advance:
+                        next_frame = now + 0.5  # Slower refresh rate to reduce flicker
+                
+                    lines = []
+                    for spinner in self.active:
+                        lines.extend(spinner.render(now, advance))
+                    if self.status:
+                        lines.append(f"{self.status}\n")
+                
+                    if len(lines) == len(self.drawn):
+                        # Same shape as the last frame, usually only a spinner and its timer moved.
+                        # Rewrite just the changed lines in place and return below the region
+                        frame = []
+                        for i, (old, new) in enumerate(zip(self.drawn, lines)):
+                            if old != new:
+                                up = len(lines) - i
+                                frame.append(f"\033[{up}A\r{new[:-1]}\033[K\033[{up}B\r")
+                    else:
+                        # Clear previous lines if any, then redraw the whole region
+                        frame = [clear_lines(len(self.drawn))] + lines
+                
+                    if frame:
+                        write_output("".join(frame))
+                    self.drawn = lines
+            finally:
+                # Always clear the thread, even when drawing fails (e.g. a closed stdout),
+                # so the next register() starts a new renderer
+                self.thread = None
+
+
 class ProgressSpinner:
     """A progress spinner with timer and recent message display for command execution."""
     
     def __init__(self, component_name: str):
         self.component_name = component_name
+        self.header = f"📦 Processing: {component_name:<40}"  # Static part of the progress line
         self.spinner_chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
         self.spinner_index = 0
         self.start_time = time.time()
-        self.running = False
-        self.thread = None
-        self.recent_messages = []
-        self.lock = threading.Lock()
+        self.elapsed_secs = -1
+        self.elapsed_str = ""
+        self.recent_messages = deque(maxlen=5)  # Last 5 messages as (live, summary) display forms
         self.stats = None  # Will be set by caller
+        self.stopped = False
     
     def start(self):
-        """Start the spinner in a background thread."""
-        self.running = True
-        self.thread = threading.Thread(target=self._spin)
-        self.thread.daemon = True
-        self.thread.start()
+        """Start drawing the spinner on the shared renderer."""
+        spinner_renderer.register(self)
     
     def add_message(self, message: str):
         """Add a message to the recent messages list."""
-        with self.lock:
-            self.recent_messages.append(message)
-            # Keep only last 5 messages
-            if len(self.recent_messages) > 5:
-                self.recent_messages = self.recent_messages[-5:]
+        # Truncate once here rather than on every frame: the live view shows 60
+        # characters, the completion summary 70
+        short = message[:60] + "..." if len(message) > 60 else message
+        long = message[:70] + "..." if len(message) > 70 else message
+        
+        # deque appends are atomic, so no lock is needed here. Only wake the renderer
+        # if it isn't already due to redraw, the next frame picks up every message
+        self.recent_messages.append((short, long))
+        if not spinner_renderer.dirty:
+            spinner_renderer.notify()
     
     def stop(self):
-        """Stop the spinner and show completion."""
-        self.running = False
-        if self.thread:
-            self.thread.join()
+        """Stop the spinner and show completion, safe to call more than once."""
+        if self.stopped:
+            return
+        self.stopped = True
         
         elapsed = time.time() - self.start_time
         mins = int(elapsed // 60)
         secs = int(elapsed % 60)
         
-        # Calculate how many lines to clear (progress line + max 5 message lines + waiting line)
-        lines_to_clear = 2  # At minimum there's the progress line and one message/waiting line
-        with self.lock:
-            if self.recent_messages:
-                lines_to_clear = 1 + len(self.recent_messages[-5:])  # progress + actual messages
+        # Build the whole completion block so it replaces the spinner in one write
+        frame = []
+        try:
+            # Show completion with stats if available
+            if self.stats:
+                frame.append(f"📦 Completed: {self.component_name:<30} ✅ {mins:02d}:{secs:02d} | ${self.stats.cost_usd:.4f} | {self.stats.input_tokens + self.stats.output_tokens:,} tokens\n")
+            else:
+                frame.append(f"📦 Completed: {self.component_name:<40} ✅ {mins:02d}:{secs:02d}\n")
+            
+            # Show final messages if any
+            final_messages = list(self.recent_messages)[-3:]  # Show last 3 messages
+            for i, (_, truncated) in enumerate(final_messages):
+                prefix = "   └─" if i == len(final_messages) - 1 else "   ├─"
+                frame.append(f"{prefix} {truncated}\n")
+        except Exception:
+            # Malformed stats from the stream, fall back to a plain completion line
+            frame = [f"📦 Completed: {self.component_name:<40} ✅ {mins:02d}:{secs:02d}\n"]
+        finally:
+            # Always leave the shared renderer, or it keeps drawing this spinner forever
+            spinner_renderer.unregister(self, "".join(frame))
+    
+    def render(self, now: float, advance: bool) -> List[str]:
+        """Return the lines for one frame, called by the renderer with its lock held."""
+        # The timer only changes once a second, so only reformat it then
+        elapsed_secs = int(now - self.start_time)
+        if elapsed_secs != self.elapsed_secs:
+            self.elapsed_secs = elapsed_secs
+            self.elapsed_str = f"{elapsed_secs // 60:02d}:{elapsed_secs % 60:02d}"
+        
+        spinner_char = self.spinner_chars[self.spinner_index]
+        if advance:
+            self.spinner_index = (self.spinner_index + 1) % len(self.spinner_chars)
         
-        # Clear the previous spinner output
-        for _ in range(lines_to_clear):
-            print("\033[1A\033[K", end="")
+        # Main progress line
+        lines = [f"{self.header} {spinner_char} {self.elapsed_str}\n"]
         
-        # Show completion with stats if available
-        if self.stats:
-            print(f"📦 Completed: {self.component_name:<30} ✅ {mins:02d}:{secs:02d} | ${self.stats.cost_usd:.4f} | {self.stats.input_tokens + self.stats.output_tokens:,} tokens")
+        # Show recent messages (last 5), from a snapshot since add_message doesn't lock
+        messages = list(self.recent_messages)
+        if messages:
+            last = len(messages) - 1
+            for i, (truncated, _) in enumerate(messages):
+                lines.append(f"   {'└─' if i == last else '├─'} {truncated}\n")
         else:
-            print(f"📦 Completed: {self.component_name:<40} ✅ {mins:02d}:{secs:02d}")
-        
-        # Show final messages if any
-        with self.lock:
-            if self.recent_messages:
-                for i, msg in enumerate(self.recent_messages[-3:]):  # Show last 3 messages
-                    truncated = msg[:70] + "..." if len(msg) > 70 else msg
-                    prefix = "   └─" if i == len(self.recent_messages[-3:]) - 1 else "   ├─"
-                    print(f"{prefix} {truncated}")
-        
-        # Restore cursor
-        print("\033[?25h", end="", flush=True)
-    
-    def _spin(self):
-        """Internal spinning animation with message display."""
-        # Hide cursor
-        print("\033[?25l", end="", flush=True)
-        lines_printed = 0
-        
-        while self.running:
-            # Clear previous lines if any
-            if lines_printed > 0:
-                for _ in range(lines_printed):
-                    print("\033[1A\033[K", end="")
-            
-            elapsed = time.time() - self.start_time
-            mins = int(elapsed // 60)
-            secs = int(elapsed % 60)
-            
-            spinner_char = self.spinner_chars[self.spinner_index]
-            self.spinner_index = (self.spinner_index + 1) % len(self.spinner_chars)
-            
-            # Get recent messages for display
-            with self.lock:
-                display_messages = self.recent_messages[-5:] if self.recent_messages else []
-            
-            # Print main progress line
-            print(f"📦 Processing: {self.component_name:<40} {spinner_char} {mins:02d}:{secs:02d}")
-            lines_printed = 1
-            
-            # Show recent messages (last 5)
-            if display_messages:
-                for i, msg in enumerate(display_messages):
-                    truncated = msg[:60] + "..." if len(msg) > 60 else msg
-                    print(f"   {'└─' if i == len(display_messages) - 1 else '├─'} {truncated}")
-                    lines_printed += 1
-            else:
-                print("   ⏳ Waiting for response...")
-                lines_printed += 1
-            
-            time.sleep(0.5)  # Slower refresh rate to reduce flicker
+            lines.append("   ⏳ Waiting for response...\n")
+        
+        return lines
+
+
+spinner_renderer = SpinnerRenderer()
 
 
 class DocumentationInitializer:
     """Main class for initializing AI documentation."""
     
-    def __init__(self, project_root: str = ".", dry_run: bool = False, verbose: bool = False, max_workers: int = 10):
+    def __init__(self, project_root: str = ".", dry_run: bool = False, verbose: bool = False, max_workers: int = 10,
+                 io_workers: int = DEFAULT_IO_WORKERS, select_pattern: Optional[str] = None):
         self.project_root = Path(project_root).resolve()
         self.dry_run = dry_run
         self.verbose = verbose
         self.max_workers = max_workers
-        self.component_dirs: List[Path] = []
-        self.component_dirs_by_depth: dict[int, List[Path]] = {}
+        self.io_workers = io_workers
+        self.select_pattern = select_pattern
+        self.component_dirs: List[ComponentDir] = []
+        self.component_dirs_by_depth: dict[int, List[ComponentDir]] = {}
+        self.components_by_rel_path: dict[str, ComponentDir] = {}
+        self.component_byte_counts: dict[Path, int] = {}
         self.component_line_counts: dict[Path, int] = {}
+        self.component_scans: dict[Path, Tuple[List[str], int]] = {}
         self.task_stats: List[TaskStats] = []
+        self.task_stats_lock = threading.Lock()
+        self.cache_file = self.project_root / LINE_COUNT_CACHE_FILE
         
         # Code file extensions to look for
-        self.code_extensions = {
-            "*.go", "*.ts", "*.js", "*.py", "*.rs", 
-            "*.java", "*.cpp", "*.c", "*.h", "*.md", "*.sh", "*.star"
-        }
-        
-        # Directories to skip
-        self.skip_patterns = {
-            ".git", ".svn", ".hg", "node_modules", "vendor", 
+        self.code_extensions = frozenset({
+            ".go", ".ts", ".js", ".py", ".rs",
+            ".java", ".cpp", ".c", ".h", ".md", ".sh", ".star"
+        })
+        
+        # Directories to skip, never descended into. Hidden directories
+        # (.venv, .next, .cache, ...) are skipped separately by name
+        self.skip_patterns = frozenset({
+            ".git", ".svn", ".hg", "node_modules", "vendor", "venv",
             "build", "dist", "target", "static", "__pycache__"
-        }
+        })
     
     def log(self, message: str):
         """Log message if verbose or dry run mode."""
         if self.verbose or self.dry_run:
-            print(message)
+            spinner_renderer.write_above(f"{message}\n")
     
     def execute_command(self, cmd: List[str], component_name: Optional[str] = None, working_dir: Optional[Path] = None) -> bool:
         """Execute a command with optional progress spinner and streaming output."""
         if self.dry_run:
-            print(f"[DRY RUN] Would execute: {' '.join(cmd)}")
+            print(f"[DRY RUN] Would execute: {shlex.join(cmd)}")
             if working_dir:
                 print(f"[DRY RUN] Working directory: {working_dir}")
             return True
         
-        self.log(f"Executing: {' '.join(cmd)}")
+        self.log(f"Executing: {shlex.join(cmd)}")
         if working_dir:
             self.log(f"Working directory: {working_dir}")
         
         if component_name:
             # Create task stats for tracking
             task_stats = TaskStats(component_name)
-            self.task_stats.append(task_stats)
+            with self.task_stats_lock:
+                self.task_stats.append(task_stats)
             
             # Run with progress spinner and streaming output
             spinner = ProgressSpinner(component_name)
@@ -209,93 +485,129 @@ class DocumentationInitializer:
             
             try:
                 # Start process for streaming
+                # Read raw bytes, the JSON parser takes them directly so there is
+                # no need for a text decoding layer on the hot path
                 process = subprocess.Popen(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    cwd=working_dir
+                    cwd=working_dir,
+                    close_fds=CLOSE_FDS
                 )
                 
-                import json
+                # Read stdout on a background thread so bursts of output can be
+                # drained and processed in batches
+                line_queue = queue.Queue()
+                reader = threading.Thread(target=enqueue_lines, args=(process.stdout, line_queue))
+                reader.daemon = True
+                reader.start()
                 
-                # Read output line by line
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
+                # Drain stderr at the same time, otherwise a chatty process fills the
+                # pipe buffer and blocks before it closes stdout
+                stderr_chunks = []
+                stderr_reader = threading.Thread(target=collect_stream, args=(process.stderr, stderr_chunks))
+                stderr_reader.daemon = True
+                stderr_reader.start()
+                
+                # Bind the parser to locals, they are looked up once per output line.
+                # Invalid UTF-8 raises UnicodeDecodeError from json, so catch ValueError
+                loads = json_loads
+                decode_error = ValueError
+                
+                finished = False
+                while not finished:
+                    # Block for the next line, then take everything else already queued
+                    batch = [line_queue.get()]
+                    try:
+                        while True:
+                            batch.append(line_queue.get_nowait())
+                    except queue.Empty:
+                        pass
                     
-                    if output:
+                    for output in batch:
+                        if output is None:  # End of stream
+                            finished = True
+                            break
+                        
                         line = output.strip()
                         
+                        # Skip non-JSON output without paying for a failed parse,
+                        # showing it only in verbose mode
+                        if not line or line[0] not in b'{[':
+                            if line and self.verbose:
+                                spinner.add_message(f"📝 {line.decode('utf-8', errors='replace')}")
+                            continue
+                        
                         # Try to parse as JSON for streaming format
                         try:
-                            json_obj = json.loads(line)
-                            
-                            # Handle different message types
-                            if isinstance(json_obj, dict):
-                                # Handle assistant messages with nested structure
-                                if json_obj.get('type') == 'assistant' and 'message' in json_obj:
-                                    message = json_obj['message']
-                                    
-                                    # Extract token usage if available
-                                    if 'usage' in message:
-                                        usage = message['usage']
-                                        input_tokens = usage.get('input_tokens', 0)
-                                        output_tokens = usage.get('output_tokens', 0)
-                                        # Update task stats with token info
-                                        task_stats.input_tokens += input_tokens
-                                        task_stats.output_tokens += output_tokens
-                                    
-                                    if 'content' in message and isinstance(message['content'], list):
-                                        for item in message['content']:
-                                            if isinstance(item, dict):
-                                                if item.get('type') == 'text':
-                                                    text = item.get('text', '').strip()
-                                                    # Only add non-empty text messages from Claude
-                                                    if text and len(text) > 10:  # Skip very short messages
-                                                        # Truncate long messages for display
-                                                        display_text = text[:100] + "..." if len(text) > 100 else text
-                                                        spinner.add_message(display_text)
-                                                elif item.get('type') == 'tool_use':
-                                                    tool_name = item.get('name', 'unknown')
-                                                    spinner.add_message(f"🔧 Using tool: {tool_name}")
-                                
-                                # Handle user messages (tool results) - skip these to reduce spam
-                                elif json_obj.get('type') == 'user' and 'message' in json_obj:
-                                    # Skip user messages (tool results) to reduce console spam
-                                    pass
-                                
-                                # Handle system messages with stats
-                                elif json_obj.get('type') == 'system':
-                                    subtype = json_obj.get('subtype', '')
-                                    if subtype == 'init':
-                                        spinner.add_message("🚀 Initializing Claude session...")
-                                    elif 'cost_usd' in json_obj:
-                                        # Extract stats from final system message
-                                        cost = json_obj.get('cost_usd', 0)
-                                        duration_ms = json_obj.get('duration_ms', 0)
-                                        # Note: Token info isn't in the system message, would need to parse from usage
-                                        task_stats.complete(cost=cost, duration_ms=duration_ms)
-                                        spinner.add_message(f"💰 Completed (${cost:.4f})")
-                                        
-                        except json.JSONDecodeError:
+                            json_obj = loads(line)
+                        except decode_error:
                             # Not JSON, could be regular text output or partial JSON
                             # Skip non-JSON output to reduce spam unless in verbose mode
-                            pass
+                            continue
+                        
+                        # Handle different message types, looking the type up only once
+                        if isinstance(json_obj, dict):
+                            msg_type = json_obj.get('type')
+                            message = json_obj.get('message')
+                            
+                            # Handle assistant messages with nested structure
+                            if msg_type == 'assistant' and isinstance(message, dict):
+                                # Extract token usage if available
+                                usage = message.get('usage')
+                                if usage:
+                                    input_tokens = usage.get('input_tokens', 0)
+                                    output_tokens = usage.get('output_tokens', 0)
+                                    # Update task stats with token info
+                                    task_stats.input_tokens += input_tokens
+                                    task_stats.output_tokens += output_tokens
+                                
+                                content = message.get('content')
+                                if isinstance(content, list):
+                                    for item in content:
+                                        if isinstance(item, dict):
+                                            item_type = item.get('type')
+                                            if item_type == 'text':
+                                                text = item.get('text', '').strip()
+                                                # Only add non-empty text messages from Claude
+                                                if text and len(text) > 10:  # Skip very short messages
+                                                    # Truncate long messages for display
+                                                    display_text = text[:100] + "..." if len(text) > 100 else text
+                                                    spinner.add_message(display_text)
+                                            elif item_type == 'tool_use':
+                                                tool_name = item.get('name', 'unknown')
+                                                spinner.add_message(f"🔧 Using tool: {tool_name}")
+                            
+                            # Handle user messages (tool results) - skip these to reduce spam
+                            elif msg_type == 'user' and message is not None:
+                                # Skip user messages (tool results) to reduce console spam
+                                pass
+                            
+                            # Handle system messages with stats
+                            elif msg_type == 'system':
+                                subtype = json_obj.get('subtype', '')
+                                if subtype == 'init':
+                                    spinner.add_message("🚀 Initializing Claude session...")
+                                elif 'cost_usd' in json_obj:
+                                    # Extract stats from final system message
+                                    cost = json_obj.get('cost_usd', 0)
+                                    duration_ms = json_obj.get('duration_ms', 0)
+                                    # Note: Token info isn't in the system message, would need to parse from usage
+                                    task_stats.complete(cost=cost, duration_ms=duration_ms)
+                                    spinner.add_message(f"💰 Completed (${cost:.4f})")
                 
                 spinner.stop()
                 
                 # Get final result
-                return_code = process.poll()
-                stderr_output = process.stderr.read()
+                return_code = process.wait()
+                stderr_reader.join()
+                stderr_output = b''.join(stderr_chunks).decode('utf-8', errors='replace')
                 
                 if return_code != 0:
-                    print(f"❌ Command failed with exit status {return_code}")
+                    message = f"❌ Command failed with exit status {return_code}\n"
                     if stderr_output:
-                        print(f"Error: {stderr_output}")
+                        message += f"Error: {stderr_output}\n"
+                    spinner_renderer.write_above(message)
                     return False
                 
                 # Mark as successful if not already marked by stats
@@ -306,7 +618,7 @@ class DocumentationInitializer:
                 
             except Exception as e:
                 spinner.stop()
-                print(f"❌ Command failed with exception: {e}")
+                spinner_renderer.write_above(f"❌ Command failed with exception: {e}\n")
                 return False
         else:
             # Run without spinner
@@ -320,11 +632,17 @@ class DocumentationInitializer:
     def check_claude_installed(self) -> bool:
         """Check if claude command is available."""
         try:
-            subprocess.run(["claude", "--version"], capture_output=True, check=True)
+            # Only the exit status matters, so don't pipe the output. The timeout leaves
+            # room for a cold Node.js start while still catching a hung binary
+            subprocess.run(["claude", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           check=True, timeout=CLAUDE_VERSION_TIMEOUT)
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             print("Error: claude could not be found -- have you installed Claude Code? (https://docs.anthropic.com/en/docs/claude-code)")
             return False
+        except subprocess.TimeoutExpired:
+            print(f"Error: 'claude --version' did not respond within {CLAUDE_VERSION_TIMEOUT} seconds")
+            return False
     
     def validate_project_root(self) -> bool:
         """Validate that project root exists."""
@@ -338,185 +656,236 @@ class DocumentationInitializer:
         
         return True
     
-    def should_skip_directory(self, dir_path: Path) -> bool:
-        """Check if directory should be skipped."""
-        # Skip if any part of path contains skip patterns
-        for part in dir_path.parts:
-            if part.startswith('.') and part != '.':
-                return True
-            if part in self.skip_patterns:
-                return True
-        
-        return False
-    
-    def has_code_files(self, dir_path: Path) -> bool:
-        """Check if directory contains code files."""
-        try:
-            for pattern in self.code_extensions:
-                if list(dir_path.glob(pattern)):
-                    return True
-            return False
-        except PermissionError:
-            return False
-    
-    def has_files(self, dir_path: Path) -> bool:
-        """Check if directory contains any files (not just subdirectories)."""
-        try:
-            for item in dir_path.iterdir():
-                if item.is_file():
-                    return True
-            return False
-        except PermissionError:
-            return False
-    
-    def count_lines_in_directory(self, dir_path: Path) -> int:
-        """Count total lines of code in all matching files in a directory."""
-        total_lines = 0
+    def scan_directory(self, dir_path: str) -> Tuple[List[str], List[str], int, int]:
+        """Scan a directory once, returning subdirectories to descend into, code file paths, their total size and latest mtime.
+        
+        The mtime is the newest of the directory itself (changes when files are
+        added or removed) and its code files, in nanoseconds. File types come
+        from the directory entries, so nothing but code files is stat'ed.
+        Symlinked files are followed, symlinked directories are not, which
+        keeps the walk free of loops.
+        """
+        subdirs = []
+        code_files = []
+        code_bytes = 0
         try:
-            for pattern in self.code_extensions:
-                for file_path in dir_path.glob(pattern):
-                    if file_path.is_file():
-                        try:
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                lines = sum(1 for line in f if line.strip())  # Count non-empty lines
-                                total_lines += lines
-                        except Exception:
-                            # Skip files that can't be read
-                            pass
-            return total_lines
-        except PermissionError:
-            return 0
-    
-    def process_directory(self, root_path: Path) -> Optional[tuple[Path, int]]:
-        """Process a single directory and return path and line count if it contains code."""
-        # Skip the project root itself
-        if root_path == self.project_root:
-            return None
-        
-        # Skip directories that should be ignored
-        if self.should_skip_directory(root_path):
-            return None
-        
-        # Skip directories with no files
-        if not self.has_files(root_path):
-            return None
-        
-        # Check if directory contains code files
-        if self.has_code_files(root_path):
-            # Count lines of code in this directory
-            line_count = self.count_lines_in_directory(root_path)
-            if line_count > 0:  # Only include directories with actual code
-                return (root_path, line_count)
-        
-        return None
+            latest_mtime = os.stat(dir_path).st_mtime_ns
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.skip_patterns and not entry.name.startswith('.'):
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        if os.path.splitext(entry.name)[1] in self.code_extensions:
+                            try:
+                                entry_stat = entry.stat()
+                            except OSError:
+                                # Removed or unreadable since the listing, skip just this file
+                                continue
+                            code_files.append(entry.path)
+                            code_bytes += entry_stat.st_size
+                            latest_mtime = max(latest_mtime, entry_stat.st_mtime_ns)
+        except OSError:
+            # Permission denied, removed mid-scan, symlink loops, I/O errors
+            return [], [], 0, 0
+        return subdirs, code_files, code_bytes, latest_mtime
 
     def find_component_directories(self):
-        """Find all directories that contain code files, organized by depth level."""
-        all_component_dirs = []
+        """Find all directories that contain code files, organized by depth level.
         
-        # Collect all directories to process
-        dirs_to_process = []
-        for root, _, _ in os.walk(self.project_root):
-            root_path = Path(root)
-            if not self.should_skip_directory(root_path):
-                dirs_to_process.append(root_path)
+        Only file metadata is read here. Directories are ranked by the size of
+        their code files, and exact line counts are left to count_component_lines.
+        """
+        all_component_dirs = []
+        candidates = []
         
-        total_dirs = len(dirs_to_process)
-        print(f"🔍 Scanning {total_dirs} directories for code files (using {self.max_workers} threads)...")
+        print(f"🔍 Scanning for code files (using {self.io_workers} threads)...")
         
         dirs_processed = 0
         start_time = time.time()
         
-        # Process directories in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_dir = {executor.submit(self.process_directory, dir_path): dir_path 
-                           for dir_path in dirs_to_process}
+        # Walk the tree in parallel, listing each directory exactly once. Subdirectories
+        # are submitted as they are found, skipped ones are never entered. This is I/O
+        # bound filesystem work, so it is sized by io_workers rather than max_workers,
+        # which bounds concurrent claude runs
+        project_root = str(self.project_root)
+        with ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='scan') as executor:
+            future_to_dir = {executor.submit(self.scan_directory, project_root): project_root}
             
-            # Process completed tasks
-            for future in as_completed(future_to_dir):
-                dirs_processed += 1
-                
-                # Show progress every 10 directories or at completion
-                if dirs_processed % 10 == 0 or dirs_processed == total_dirs:
-                    elapsed = time.time() - start_time
-                    rate = dirs_processed / elapsed if elapsed > 0 else 0
-                    eta = (total_dirs - dirs_processed) / rate if rate > 0 else 0
-                    print(f"   Progress: {dirs_processed}/{total_dirs} ({dirs_processed/total_dirs*100:.1f}%) | "
-                          f"Rate: {rate:.1f} dirs/sec | ETA: {eta:.1f}s", end='\r')
-                
-                try:
-                    result = future.result()
-                    if result:
-                        dir_path, line_count = result
-                        all_component_dirs.append(dir_path)
-                        self.component_line_counts[dir_path] = line_count
-                except Exception as e:
-                    dir_path = future_to_dir[future]
-                    self.log(f"Error processing {dir_path}: {e}")
+            while future_to_dir:
+                done, _ = wait(future_to_dir, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dir_path = future_to_dir.pop(future)
+                    dirs_processed += 1
+                    
+                    # Show progress every 10 directories
+                    if dirs_processed % 10 == 0:
+                        elapsed = time.time() - start_time
+                        rate = dirs_processed / elapsed if elapsed > 0 else 0
+                        print(f"   Progress: {dirs_processed} directories | Rate: {rate:.1f} dirs/sec", end='\r')
+                    
+                    try:
+                        subdirs, code_files, code_bytes, latest_mtime = future.result()
+                    except Exception as e:
+                        self.log(f"Error processing {dir_path}: {e}")
+                        continue
+                    
+                    for subdir in subdirs:
+                        future_to_dir[executor.submit(self.scan_directory, subdir)] = subdir
+                    
+                    # Skip the project root itself
+                    if code_files and dir_path != project_root:
+                        candidates.append((Path(dir_path), code_files, code_bytes, latest_mtime))
         
         # Clear progress line
         print(" " * 100, end='\r')
         
+        for dir_path, code_files, code_bytes, latest_mtime in candidates:
+            if code_bytes > 0:  # Only include directories with actual code
+                all_component_dirs.append(dir_path)
+                self.component_byte_counts[dir_path] = code_bytes
+                self.component_scans[dir_path] = (code_files, latest_mtime)
+        
         elapsed = time.time() - start_time
-        print(f"✅ Scanned {total_dirs} directories in {elapsed:.1f}s ({total_dirs/elapsed:.1f} dirs/sec)")
+        print(f"✅ Scanned {dirs_processed} directories in {elapsed:.1f}s ({dirs_processed/elapsed:.1f} dirs/sec)")
+        
+        # Compute relative paths once, everything downstream reads them from here.
+        # The way back to the project root only depends on depth, so components at
+        # the same depth share one string
+        components = []
+        rel_project_root_by_depth = {}
+        for component_dir in sorted(all_component_dirs):
+            rel_parts = component_dir.relative_to(self.project_root).parts
+            depth = len(rel_parts)  # Number of path parts from project root
+            if depth not in rel_project_root_by_depth:
+                rel_project_root_by_depth[depth] = os.sep.join([os.pardir] * depth)
+            components.append(ComponentDir(
+                path=component_dir,
+                rel_path=str(Path(*rel_parts)),
+                rel_parts=rel_parts,
+                rel_project_root=rel_project_root_by_depth[depth],
+                depth=depth
+            ))
+        
+        # Index every discovered component once, in path order, so strategies can look them up
+        self.components_by_rel_path = {c.rel_path: c for c in components}
+        self.group_components_by_depth(components)
+    
+    def count_component_lines(self):
+        """Count lines of code for the current component directories, reusing cached counts."""
+        # Reuse line counts from a previous run for directories that haven't changed since
+        cache = self.load_line_count_cache()
+        to_count = []
+        for component in self.component_dirs:
+            if component.path in self.component_line_counts:
+                continue
+            code_files, latest_mtime = self.component_scans[component.path]
+            code_bytes = self.component_byte_counts[component.path]
+            cached = cache.get(component.rel_path)
+            # Require the total size to match too, since copies and some tools preserve mtimes
+            if (isinstance(cached, dict) and cached.get('mtime') == latest_mtime
+                    and cached.get('bytes') == code_bytes):
+                self.component_line_counts[component.path] = cached.get('lines', 0)
+            else:
+                self.component_line_counts[component.path] = 0
+                to_count.append((component.path, code_files))
+        
+        # Count lines file by file on a wide I/O pool. Counting is done in C, so
+        # the time goes to open/read latency and many reads should be in flight
+        if to_count:
+            file_owners = [dir_path for dir_path, code_files in to_count for _ in code_files]
+            file_paths = [file_path for _, code_files in to_count for file_path in code_files]
+            with ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='count') as executor:
+                for dir_path, file_lines in zip(file_owners, executor.map(count_file_lines, file_paths)):
+                    self.component_line_counts[dir_path] += file_lines
+        
+        # Keep cached counts for unselected directories that still exist, so a
+        # different selection on the next run can reuse them too
+        entries = {}
+        for dir_path, (_, latest_mtime) in self.component_scans.items():
+            rel_path = str(dir_path.relative_to(self.project_root))
+            if dir_path in self.component_line_counts:
+                entries[rel_path] = {
+                    'mtime': latest_mtime,
+                    'bytes': self.component_byte_counts[dir_path],
+                    'lines': self.component_line_counts[dir_path],
+                }
+            elif rel_path in cache:
+                entries[rel_path] = cache[rel_path]
+        self.save_line_count_cache(entries)
+    
+    def load_line_count_cache(self) -> dict:
+        """Load per-directory line counts saved by a previous run."""
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == LINE_COUNT_CACHE_VERSION:
+                return data.get('entries', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+    
+    def save_line_count_cache(self, entries: dict):
+        """Save per-directory line counts for the next run."""
+        if self.dry_run:
+            return
         
-        # Group directories by depth level (number of path parts from project root)
+        try:
+            with open(self.cache_file, 'w') as f:
+                json.dump({'version': LINE_COUNT_CACHE_VERSION, 'entries': entries}, f)
+        except OSError as e:
+            self.log(f"Could not write line count cache: {e}")
+    
+    def group_components_by_depth(self, components: List[ComponentDir]):
+        """Group components by depth level. Components must already be in path order, which each level keeps."""
         self.component_dirs_by_depth = {}
-        for component_dir in all_component_dirs:
-            rel_path = component_dir.relative_to(self.project_root)
-            depth = len(rel_path.parts)
-            
-            if depth not in self.component_dirs_by_depth:
-                self.component_dirs_by_depth[depth] = []
-            self.component_dirs_by_depth[depth].append(component_dir)
+        for component in components:
+            if component.depth not in self.component_dirs_by_depth:
+                self.component_dirs_by_depth[component.depth] = []
+            self.component_dirs_by_depth[component.depth].append(component)
         
-        # Sort directories within each depth level for consistent processing
-        for depth in self.component_dirs_by_depth:
-            self.component_dirs_by_depth[depth].sort()
-        
-        # Also maintain flat list for backward compatibility
+        # Also maintain flat list ordered by depth
         self.component_dirs = []
         for depth in sorted(self.component_dirs_by_depth.keys()):
             self.component_dirs.extend(self.component_dirs_by_depth[depth])
     
     def create_directory_strategies(self) -> dict:
         """Create documentation strategies based on directory analysis."""
-        all_dirs = [str(d.relative_to(self.project_root)) for d in self.component_dirs]
-        
-        # Calculate statistics
-        line_counts = list(self.component_line_counts.values())
-        if line_counts:
-            avg_lines = sum(line_counts) / len(line_counts)
-            sorted_counts = sorted(line_counts, reverse=True)
-            percentile_75 = sorted_counts[int(len(sorted_counts) * 0.25)] if len(sorted_counts) >= 4 else avg_lines
-            percentile_50 = sorted_counts[int(len(sorted_counts) * 0.5)] if len(sorted_counts) >= 2 else avg_lines
+        all_dirs = [c.rel_path for c in self.component_dirs]
+        
+        # Calculate statistics. Code size in bytes stands in for line count, the
+        # thresholds are relative so the unit doesn't matter
+        byte_counts = list(self.component_byte_counts.values())
+        if byte_counts:
+            avg_bytes = sum(byte_counts) / len(byte_counts)
+            sorted_counts = sorted(byte_counts, reverse=True)
+            percentile_75 = sorted_counts[int(len(sorted_counts) * 0.25)] if len(sorted_counts) >= 4 else avg_bytes
+            percentile_50 = sorted_counts[int(len(sorted_counts) * 0.5)] if len(sorted_counts) >= 2 else avg_bytes
         else:
-            avg_lines = percentile_75 = percentile_50 = 0
+            avg_bytes = percentile_75 = percentile_50 = 0
         
         # Score and categorize directories
         dir_info = []
-        for d in self.component_dirs:
-            rel_path = d.relative_to(self.project_root)
-            lines = self.component_line_counts.get(d, 0)
+        for c in self.component_dirs:
+            code_bytes = self.component_byte_counts.get(c.path, 0)
             
             # Calculate importance score
             score = 0
             reasons = []
             
             # Size factor
-            if lines > percentile_75:
+            if code_bytes > percentile_75:
                 score += 30
                 reasons.append("large codebase")
-            elif lines > percentile_50:
+            elif code_bytes > percentile_50:
                 score += 20
                 reasons.append("substantial code")
-            elif lines > avg_lines:
+            elif code_bytes > avg_bytes:
                 score += 10
                 reasons.append("above average size")
             
             # Depth factor (prefer shallower directories)
-            depth = len(rel_path.parts)
+            depth = c.depth
             if depth == 1:
                 score += 25
                 reasons.append("top-level")
@@ -526,31 +895,21 @@ class DocumentationInitializer:
             elif depth == 3:
                 score += 5
             
-            # Name importance
-            path_str = str(rel_path).lower()
-            important_keywords = {
-                'src': 20, 'lib': 20, 'core': 25, 'api': 20,
-                'service': 15, 'model': 15, 'controller': 15,
-                'handler': 15, 'manager': 15, 'util': 5, 'utils': 5,
-                'helper': 5, 'common': 10, 'shared': 10,
-                'main': 20, 'app': 20, 'server': 20, 'client': 20
-            }
-            
-            for keyword, points in important_keywords.items():
-                if keyword in path_str.split('/'):
-                    score += points
-                    reasons.append(f"'{keyword}' component")
-                    break
+            # Name importance, one dict lookup per path component
+            matched_keywords = [part for part in (p.lower() for p in c.rel_parts) if part in IMPORTANT_KEYWORDS]
+            if matched_keywords:
+                keyword = min(matched_keywords, key=IMPORTANT_KEYWORD_PRIORITY.__getitem__)
+                score += IMPORTANT_KEYWORDS[keyword]
+                reasons.append(f"'{keyword}' component")
             
             # Negative patterns
-            if any(word in path_str for word in ['test', 'tests', 'mock', 'example', 'demo', 'sample']):
+            if NEGATIVE_PATTERN.search(c.rel_path.lower()):
                 score *= 0.5
-                reasons = [r for r in reasons if r != "test/example code"]
                 reasons.append("test/example code")
             
             dir_info.append({
-                'path': str(rel_path),
-                'lines': lines,
+                'path': c.rel_path,
+                'bytes': code_bytes,
                 'score': score,
                 'depth': depth,
                 'reasons': reasons
@@ -563,49 +922,42 @@ class DocumentationInitializer:
         minimal_threshold = 50  # High score threshold
         smart_threshold = 25    # Medium score threshold
         
-        minimal_dirs = [d['path'] for d in dir_info if d['score'] >= minimal_threshold]
-        smart_dirs = [d['path'] for d in dir_info if d['score'] >= smart_threshold]
+        # dir_info is sorted by score, so each strategy is a prefix of it
+        minimal_count = sum(1 for d in dir_info if d['score'] >= minimal_threshold)
+        smart_count = sum(1 for d in dir_info if d['score'] >= smart_threshold)
         
         # Ensure we have at least some directories in minimal/smart
-        if len(minimal_dirs) < 5 and len(dir_info) >= 5:
-            minimal_dirs = [d['path'] for d in dir_info[:5]]
-        if len(smart_dirs) < 10 and len(dir_info) >= 10:
-            smart_dirs = [d['path'] for d in dir_info[:10]]
+        if minimal_count < 5 and len(dir_info) >= 5:
+            minimal_count = 5
+        if smart_count < 10 and len(dir_info) >= 10:
+            smart_count = 10
         
-        # Build reasoning
+        # Build reasoning from the most common reasons in each prefix, in a single sweep
         minimal_reasons = []
         smart_reasons = []
+        reason_counts = Counter()
+        for i, d in enumerate(dir_info[:max(minimal_count, smart_count)], start=1):
+            reason_counts.update(d['reasons'])
+            if i == minimal_count:
+                minimal_reasons = [r for r, _ in reason_counts.most_common(3)]
+            if i == smart_count:
+                smart_reasons = [r for r, _ in reason_counts.most_common(3)]
         
-        if minimal_dirs:
-            top_dirs = dir_info[:len(minimal_dirs)]
-            common_reasons = {}
-            for d in top_dirs:
-                for r in d['reasons']:
-                    common_reasons[r] = common_reasons.get(r, 0) + 1
-            top_reasons = sorted(common_reasons.items(), key=lambda x: x[1], reverse=True)[:3]
-            minimal_reasons = [r[0] for r in top_reasons]
-        
-        if smart_dirs:
-            top_dirs = dir_info[:len(smart_dirs)]
-            common_reasons = {}
-            for d in top_dirs:
-                for r in d['reasons']:
-                    common_reasons[r] = common_reasons.get(r, 0) + 1
-            top_reasons = sorted(common_reasons.items(), key=lambda x: x[1], reverse=True)[:3]
-            smart_reasons = [r[0] for r in top_reasons]
+        minimal_details = dir_info[:minimal_count]
+        smart_details = dir_info[:smart_count]
         
         return {
             "minimal": {
-                "directories": minimal_dirs,
+                "directories": [d['path'] for d in minimal_details],
                 "reasoning": f"Focus on {', '.join(minimal_reasons[:2])} directories",
-                "count": len(minimal_dirs),
-                "details": [d for d in dir_info if d['path'] in minimal_dirs]
+                "count": minimal_count,
+                "details": minimal_details
             },
             "smart": {
-                "directories": smart_dirs,
+                "directories": [d['path'] for d in smart_details],
                 "reasoning": f"Cover {', '.join(smart_reasons[:2])} with good architecture coverage",
-                "count": len(smart_dirs),
-                "details": [d for d in dir_info if d['path'] in smart_dirs]
+                "count": smart_count,
+                "details": smart_details
             },
             "full": {
                 "directories": all_dirs,
@@ -634,7 +986,7 @@ class DocumentationInitializer:
                 print("   Top directories:")
                 for detail in strategy['details'][:10]:
                     reasons_str = ", ".join(detail['reasons'][:2])
-                    print(f"     - {detail['path']} ({detail['lines']:,} lines, score: {detail['score']}, {reasons_str})")
+                    print(f"     - {detail['path']} ({format_kb(detail['bytes'])}, score: {detail['score']}, {reasons_str})")
                 if len(strategy['directories']) > 10:
                     print(f"     ... and {len(strategy['directories']) - 10} more")
             print()
@@ -668,20 +1020,22 @@ class DocumentationInitializer:
         dir_info = []
         
         # Prepare directory info sorted by score
-        for d in self.component_dirs:
-            rel_path = d.relative_to(self.project_root)
-            lines = self.component_line_counts.get(d, 0)
+        for c in self.component_dirs:
             dir_info.append({
-                'path': d,
-                'rel_path': str(rel_path),
-                'lines': lines
+                'path': c.path,
+                'rel_path': c.rel_path,
+                'bytes': self.component_byte_counts.get(c.path, 0)
             })
         
-        # Sort by lines (descending) for better review order
-        dir_info.sort(key=lambda x: x['lines'], reverse=True)
+        # Sort by size (descending) for better review order
+        dir_info.sort(key=lambda x: x['bytes'], reverse=True)
         
-        for i, info in enumerate(dir_info):
-            print(f"\n[{i+1}/{len(dir_info)}] {info['rel_path']} ({info['lines']:,} lines)")
+        # Format every heading up front so the loop only waits on input
+        headings = [f"\n[{i+1}/{len(dir_info)}] {info['rel_path']} ({format_kb(info['bytes'])})"
+                    for i, info in enumerate(dir_info)]
+        
+        for info, heading in zip(dir_info, headings):
+            print(heading)
             
             while True:
                 choice = input("   Include? [y/n/q]: ").strip().lower()
@@ -700,6 +1054,12 @@ class DocumentationInitializer:
         
         print(f"\n✅ Manual selection complete: {len(selected)} directories selected")
         return selected
+    
+    def select_directories_matching(self, pattern: str) -> List[str]:
+        """Select every directory whose relative path matches a glob pattern."""
+        selected = [c.rel_path for c in self.component_dirs if fnmatch.fnmatch(c.rel_path, pattern)]
+        print(f"✅ Selected {len(selected)} directories matching '{pattern}'")
+        return selected
 
     def apply_strategy(self, strategy_name: str, strategies: dict):
         """Apply the selected strategy to filter component directories."""
@@ -709,82 +1069,67 @@ class DocumentationInitializer:
         elif strategy_name == 'manual':
             # Manual selection
             selected_paths = self.select_directories_manually()
-            selected_dirs = set()
-            for path_str in selected_paths:
-                dir_path = self.project_root / path_str
-                if dir_path in self.component_dirs:
-                    selected_dirs.add(dir_path)
+        elif strategy_name == 'matching':
+            # Glob selection from the command line, no prompting
+            selected_paths = self.select_directories_matching(self.select_pattern)
         else:
             # Use predefined strategy
             strategy = strategies.get(strategy_name, {})
-            selected_dirs = set()
-            for dir_str in strategy.get('directories', []):
-                dir_path = self.project_root / dir_str
-                if dir_path in self.component_dirs:
-                    selected_dirs.add(dir_path)
+            selected_paths = strategy.get('directories', [])
         
-        # Update component directories
-        self.component_dirs = sorted(list(selected_dirs))
-        
-        # Rebuild depth grouping
-        self.component_dirs_by_depth = {}
-        for component_dir in self.component_dirs:
-            rel_path = component_dir.relative_to(self.project_root)
-            depth = len(rel_path.parts)
-            
-            if depth not in self.component_dirs_by_depth:
-                self.component_dirs_by_depth[depth] = []
-            self.component_dirs_by_depth[depth].append(component_dir)
-        
-        # Sort directories within each depth level
-        for depth in self.component_dirs_by_depth:
-            self.component_dirs_by_depth[depth].sort()
+        # Update component directories and rebuild depth grouping. The index is in
+        # discovery (path) order, so filtering it keeps the selection sorted
+        selected_paths = set(selected_paths)
+        self.group_components_by_depth([c for rel_path, c in self.components_by_rel_path.items() if rel_path in selected_paths])
 
     def show_plan(self):
         """Display the documentation plan."""
-        print()
-        print("📋 Documentation Plan")
-        print("==================")
-        print()
-        print("🎯 Project Root:")
-        print("   ├── CLAUDE.md")
-        print("   ├── .cursor/")
-        print("   │   └── rules/")
-        print("   │       ├── project_architecture.mdc")
-        print("   │       ├── code_standards.mdc")
-        print("   │       └── development_workflow.mdc")
-        print("   ├── llms/ -> .cursor (symlink)")
-        print("   └── .roo/ -> .cursor (symlink)")
-        print("   └── ai_docs/ -> .cursor (symlink)")
-        print()
+        # Collect the whole plan and write it at once, it can run to thousands of lines
+        parts = []
+        append = parts.append
+        append("")
+        append("📋 Documentation Plan")
+        append("==================")
+        append("")
+        append("🎯 Project Root:")
+        append("   ├── CLAUDE.md")
+        append("   ├── .cursor/")
+        append("   │   └── rules/")
+        append("   │       ├── project_architecture.mdc")
+        append("   │       ├── code_standards.mdc")
+        append("   │       └── development_workflow.mdc")
+        append("   ├── llms/ -> .cursor (symlink)")
+        append("   └── .roo/ -> .cursor (symlink)")
+        append("   └── ai_docs/ -> .cursor (symlink)")
+        append("")
         
         if not self.component_dirs:
-            print("⚠️  No component directories found")
+            append("⚠️  No component directories found")
         else:
-            print(f"📦 Components ({len(self.component_dirs)} directories - processed by depth):")
-            print()
+            append(f"📦 Components ({len(self.component_dirs)} directories - processed by depth):")
+            append("")
             
             for depth in sorted(self.component_dirs_by_depth.keys()):
                 depth_dirs = self.component_dirs_by_depth[depth]
-                print(f"   📂 Depth {depth} ({len(depth_dirs)} directories):")
+                append(f"   📂 Depth {depth} ({len(depth_dirs)} directories):")
                 
-                for i, component_dir in enumerate(depth_dirs):
-                    rel_path = component_dir.relative_to(self.project_root)
-                    lines = self.component_line_counts.get(component_dir, 0)
+                for i, component in enumerate(depth_dirs):
+                    lines = self.component_line_counts.get(component.path, 0)
                     
                     prefix = "   └──" if i == len(depth_dirs) - 1 else "   ├──"
-                    print(f"   {prefix} {rel_path}/ ({lines:,} lines)")
-                    print(f"       └── CLAUDE.md + CURSOR.mdc")
-                print()
-        
-        print()
-        print("📊 Summary:")
-        print("   • Will create 1 project root with .cursor/rules/ structure")
-        print(f"   • Will create CLAUDE.md + CURSOR.mdc in {len(self.component_dirs)} component directories")
-        print("   • Components will be processed by depth level (deepest first)")
-        print("   • Each CURSOR.mdc includes glob patterns for auto-attachment")
-        print("   • Each component CLAUDE.md references project root rules, and will create an equivalent rule in .cursor/rules/")
-        print()
+                    append(f"   {prefix} {component.rel_path}/ ({lines:,} lines)")
+                    append(f"       └── CLAUDE.md + CURSOR.mdc")
+                append("")
+        
+        append("")
+        append("📊 Summary:")
+        append("   • Will create 1 project root with .cursor/rules/ structure")
+        append(f"   • Will create CLAUDE.md + CURSOR.mdc in {len(self.component_dirs)} component directories")
+        append("   • Components will be processed by depth level (deepest first)")
+        append("   • Each CURSOR.mdc includes glob patterns for auto-attachment")
+        append("   • Each component CLAUDE.md references project root rules, and will create an equivalent rule in .cursor/rules/")
+        append("")
+        write_output("\n".join(parts) + "\n")
     
     def confirm_execution(self) -> bool:
         """Ask user for confirmation to proceed."""
@@ -819,64 +1164,19 @@ class DocumentationInitializer:
             rules_dir.mkdir(exist_ok=True)
             
             # Create basic rule template files if they don't exist
-            rule_templates = {
-                "project_architecture.mdc": """# Project Architecture
-
-This file contains project-specific architecture guidelines and patterns.
-
-## Overview
-- Project structure and organization
-- Module dependencies and relationships
-- Key architectural decisions
-
-## Guidelines
-- Follow established patterns in the codebase
-- Maintain consistency with existing architecture
-- Document significant architectural changes
-
-_This file will be auto-generated and customized by Claude AI._
-""",
-                "code_standards.mdc": """# Code Standards
-
-This file defines coding standards and conventions for this project.
-
-## Code Style
-- Follow language-specific best practices
-- Maintain consistency with existing code
-- Use meaningful names for variables and functions
-
-## Documentation
-- Document public APIs and interfaces
-- Include examples where helpful
-- Keep documentation up to date
-
-_This file will be auto-generated and customized by Claude AI._
-""",
-                "development_workflow.mdc": """# Development Workflow
-
-This file outlines the development workflow and processes for this project.
-
-## Workflow
-- Feature branch development
-- Code review requirements
-- Testing standards
-
-## Tools and Processes
-- Build and deployment procedures
-- Quality assurance practices
-- Change management
-
-_This file will be auto-generated and customized by Claude AI._
-"""
-            }
-            
-            for filename, content in rule_templates.items():
-                rule_file = rules_dir / filename
-                if not rule_file.exists():
-                    print(f"   📝 Creating rule template: {filename}")
-                    rule_file.write_text(content)
-                else:
+            for filename, content in RULE_TEMPLATES.items():
+                # O_EXCL checks for an existing file and creates it in one step
+                try:
+                    fd = os.open(rules_dir / filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                except FileExistsError:
                     print(f"   📝 Rule file already exists: {filename}")
+                    continue
+                
+                print(f"   📝 Creating rule template: {filename}")
+                try:
+                    os.write(fd, content.encode('utf-8'))
+                finally:
+                    os.close(fd)
             
             # Create symbolic links
             symlinks = [
@@ -886,23 +1186,7 @@ _This file will be auto-generated and customized by Claude AI._
             ]
             
             for link_name, target in symlinks:
-                link_path = self.project_root / link_name
-                
-                # Remove existing link/file if it exists
-                if link_path.exists() or link_path.is_symlink():
-                    if link_path.is_symlink():
-                        print(f"   🔗 Removing existing symlink: {link_name}")
-                        link_path.unlink()
-                    elif link_path.is_dir():
-                        print(f"   ⚠️  Directory {link_name} already exists, skipping symlink creation")
-                        continue
-                    else:
-                        print(f"   ⚠️  File {link_name} already exists, skipping symlink creation")
-                        continue
-                
-                # Create the symbolic link
-                print(f"   🔗 Creating symlink: {link_name} -> {target}")
-                link_path.symlink_to(target)
+                self.ensure_symlink(link_name, target)
             
             print("   ✅ Directory structure and symlinks created successfully")
             return True
@@ -911,6 +1195,36 @@ _This file will be auto-generated and customized by Claude AI._
             print(f"❌ Failed to create directory structure: {e}")
             return False
     
+    def ensure_symlink(self, link_name: str, target: str):
+        """Point link_name in the project root at target, leaving real files and directories alone."""
+        link_path = self.project_root / link_name
+        
+        # Nothing is usually there, so try to create the link straight away
+        try:
+            os.symlink(target, link_path)
+            print(f"   🔗 Creating symlink: {link_name} -> {target}")
+            return
+        except FileExistsError:
+            pass
+        
+        # Something exists. A single lstat tells us what, including dangling symlinks
+        mode = os.lstat(link_path).st_mode
+        if stat.S_ISLNK(mode):
+            if os.readlink(link_path) == target:
+                print(f"   🔗 Symlink already exists: {link_name} -> {target}")
+                return
+            print(f"   🔗 Removing existing symlink: {link_name}")
+            link_path.unlink()
+        elif stat.S_ISDIR(mode):
+            print(f"   ⚠️  Directory {link_name} already exists, skipping symlink creation")
+            return
+        else:
+            print(f"   ⚠️  File {link_name} already exists, skipping symlink creation")
+            return
+        
+        print(f"   🔗 Creating symlink: {link_name} -> {target}")
+        os.symlink(target, link_path)
+    
     def execute_claude_command(self, command: str, component_name: str, working_dir: Optional[Path] = None) -> bool:
         """Execute a claude command with parameters, optionally from a specific working directory."""
         cmd = [
@@ -918,19 +1232,29 @@ _This file will be auto-generated and customized by Claude AI._
             "--verbose", "--output-format", "stream-json",
             f"/{command}"
         ]
-        print(f"Executing: {' '.join(cmd)}")
-        if working_dir:
-            print(f"Working directory: {working_dir}")
         return self.execute_command(cmd, component_name, working_dir)
     
+    def submit_component(self, executor: ThreadPoolExecutor, component: ComponentDir) -> Future:
+        """Submit init-component-ai-docs for a component directory to the executor."""
+        return executor.submit(
+            self.execute_claude_command,
+            f"user:init-component-ai-docs project-root={component.rel_project_root},component-dir=.",
+            component.rel_path,
+            working_dir=component.path
+        )
+    
     def show_summary(self):
         """Show a summary of all completed tasks with stats."""
         if not self.task_stats:
             return
             
-        print("\n" + "="*80)
-        print("📊 EXECUTION SUMMARY")
-        print("="*80)
+        # Built up and written in one go so the summary lands as a single block
+        parts = []
+        append = parts.append
+        append("")
+        append("="*80)
+        append("📊 EXECUTION SUMMARY")
+        append("="*80)
         
         total_cost = 0.0
         total_tokens = 0
@@ -950,30 +1274,31 @@ _This file will be auto-generated and customized by Claude AI._
                 tokens = stats.input_tokens + stats.output_tokens
                 
                 status = "✅" if stats.success else "❌"
-                print(f"{i+1:2d}. {status} {stats.name:<30} | {mins:02d}:{secs:02d} | ${stats.cost_usd:>8.4f} | {tokens:>6,} tokens")
+                append(f"{i+1:2d}. {status} {stats.name:<30} | {mins:02d}:{secs:02d} | ${stats.cost_usd:>8.4f} | {tokens:>6,} tokens")
         
-        print("-" * 80)
+        append("-" * 80)
         
         # Overall totals
         total_mins = int(total_duration // 60)
         total_secs = int(total_duration % 60)
         
-        print(f"📈 TOTALS:")
-        print(f"   ✅ Successful tasks: {successful_tasks}/{len(self.task_stats)}")
-        print(f"   ⏱️  Total time: {total_mins:02d}:{total_secs:02d}")
-        print(f"   💰 Total cost: ${total_cost:.4f}")
-        print(f"   🔤 Total tokens: {total_tokens:,}")
-        print(f"   🧵 Max workers used: {self.max_workers}")
+        append(f"📈 TOTALS:")
+        append(f"   ✅ Successful tasks: {successful_tasks}/{len(self.task_stats)}")
+        append(f"   ⏱️  Total time: {total_mins:02d}:{total_secs:02d}")
+        append(f"   💰 Total cost: ${total_cost:.4f}")
+        append(f"   🔤 Total tokens: {total_tokens:,}")
+        append(f"   🧵 Max workers used: {self.max_workers}")
         
         if total_tokens > 0:
             avg_cost_per_token = total_cost / total_tokens * 1000  # Cost per 1K tokens
-            print(f"   📊 Avg cost/1K tokens: ${avg_cost_per_token:.4f}")
+            append(f"   📊 Avg cost/1K tokens: ${avg_cost_per_token:.4f}")
         
         if successful_tasks > 0 and total_duration > 0:
             avg_time_per_task = total_duration / successful_tasks
-            print(f"   ⚡ Avg time per task: {avg_time_per_task:.1f}s")
+            append(f"   ⚡ Avg time per task: {avg_time_per_task:.1f}s")
         
-        print("="*80)
+        append("="*80)
+        write_output("\n".join(parts) + "\n")
     
     def run(self) -> bool:
         """Run the full documentation initialization process."""
@@ -997,16 +1322,17 @@ _This file will be auto-generated and customized by Claude AI._
         
         # Strategy selection
         print()
-        total_lines = sum(self.component_line_counts.values())
-        print(f"📊 Found {len(self.component_dirs)} directories with {total_lines:,} total lines of code.")
+        total_bytes = sum(self.component_byte_counts.values())
+        print(f"📊 Found {len(self.component_dirs)} directories with {format_kb(total_bytes)} of code.")
         print("Let's choose a documentation strategy.")
         print()
         
         # Create and select strategy
         print("📊 Analyzing project structure...")
         strategies = self.create_directory_strategies()
-        selected_strategy = self.select_strategy(strategies)
+        selected_strategy = 'matching' if self.select_pattern else self.select_strategy(strategies)
         self.apply_strategy(selected_strategy, strategies)
+        self.count_component_lines()
         print()
         
         self.show_plan()
@@ -1032,53 +1358,54 @@ _This file will be auto-generated and customized by Claude AI._
             processed_dirs = 0
             failed_dirs = []
             
-            for depth in sorted(self.component_dirs_by_depth.keys(), reverse=True):
-                depth_dirs = self.component_dirs_by_depth[depth]
-                print(f"🔄 Processing depth {depth} ({len(depth_dirs)} directories)...")
-                
-                # Process directories at this depth in parallel
-                start_time = time.time()
-                
-                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                    # Create tasks for each directory
+            # One pool for the whole run, so worker threads are reused from depth to depth
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='claude') as executor:
+                for depth in sorted(self.component_dirs_by_depth.keys(), reverse=True):
+                    depth_dirs = self.component_dirs_by_depth[depth]
+                    print(f"🔄 Processing depth {depth} ({len(depth_dirs)} directories)...")
+                    
+                    # Process directories at this depth in parallel
+                    start_time = time.time()
+                    
+                    # Keep a bounded window of tasks in flight instead of creating a future
+                    # for every directory up front, topping it up as tasks complete
+                    pending_dirs = iter(depth_dirs)
                     future_to_dir = {}
-                    for component_dir in depth_dirs:
-                        rel_path = component_dir.relative_to(self.project_root)
-                        rel_project_root = os.path.relpath(self.project_root, component_dir)
-                        
-                        future = executor.submit(
-                            self.execute_claude_command,
-                            f"user:init-component-ai-docs project-root={rel_project_root},component-dir=.",
-                            str(rel_path),
-                            working_dir=component_dir
-                        )
-                        future_to_dir[future] = component_dir
+                    for component in islice(pending_dirs, self.max_workers * 2):
+                        future_to_dir[self.submit_component(executor, component)] = component
                     
                     # Process completed tasks
-                    for future in as_completed(future_to_dir):
-                        processed_dirs += 1
-                        component_dir = future_to_dir[future]
-                        rel_path = component_dir.relative_to(self.project_root)
-                        
-                        try:
-                            success = future.result()
-                            if not success:
-                                failed_dirs.append(str(rel_path))
-                                print(f"   ❌ Failed: {rel_path}")
-                        except Exception as e:
-                            failed_dirs.append(str(rel_path))
-                            print(f"   ❌ Error processing {rel_path}: {e}")
-                        
-                        # Show progress - don't overwrite on every update to see failures
-                        if processed_dirs % 5 == 0 or processed_dirs == total_dirs:
-                            elapsed = time.time() - start_time
-                            # Clear the line and print progress
-                            print(" " * 80, end='\r')
-                            print(f"   Progress: {processed_dirs}/{total_dirs} ({processed_dirs/total_dirs*100:.1f}%)", end='\r')
-                
-                elapsed = time.time() - start_time
-                print(f"✅ Completed depth {depth} in {elapsed:.1f}s")
-                print()
+                    while future_to_dir:
+                        done, _ = wait(future_to_dir, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            processed_dirs += 1
+                            rel_path = future_to_dir.pop(future).rel_path
+                            
+                            try:
+                                success = future.result()
+                                if not success:
+                                    failed_dirs.append(rel_path)
+                                    spinner_renderer.write_above(f"   ❌ Failed: {rel_path}\n")
+                            except Exception as e:
+                                failed_dirs.append(rel_path)
+                                spinner_renderer.write_above(f"   ❌ Error processing {rel_path}: {e}\n")
+                            
+                            # Progress is drawn below the spinners by the renderer on its
+                            # next frame, so nothing is written from here
+                            spinner_renderer.set_status(f"   Progress: {processed_dirs}/{total_dirs} ({processed_dirs/total_dirs*100:.1f}%)")
+                            
+                            for component in islice(pending_dirs, 1):
+                                future_to_dir[self.submit_component(executor, component)] = component
+                    
+                    elapsed = time.time() - start_time
+                    print(f"✅ Completed depth {depth} in {elapsed:.1f}s")
+                    print()
+            
+            # The footer goes away with the last spinner, before the final count is drawn,
+            # so print the finished progress line here
+            spinner_renderer.set_status(None)
+            if processed_dirs:
+                print(f"   Progress: {processed_dirs}/{total_dirs} ({processed_dirs/total_dirs*100:.1f}%)")
             
             if failed_dirs:
                 print(f"\n⚠️  {len(failed_dirs)} directories failed to process:")
@@ -1123,6 +1450,17 @@ _This file will be auto-generated and customized by Claude AI._
         return True
 
 
+def positive_int(value: str) -> int:
+    """Parse a worker count for argparse, rejecting zero and negative values."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -1141,6 +1479,9 @@ Examples:
 
   # Run with 20 parallel threads for faster execution
   %(prog)s --max-workers 20
+
+  # Document only components under pkg/ without prompting for a strategy
+  %(prog)s --select-all-matching 'pkg/*'
         """
     )
     
@@ -1164,12 +1505,26 @@ Examples:
     )
     
     parser.add_argument(
-        "-w", "--max-workers",
-        type=int,
+        "-w", "--max-workers", "-j", "--jobs",
+        dest="max_workers",
+        type=positive_int,
         default=1,
         help="Maximum number of concurrent threads (default: 1). Warning: enabling more than 1 worker may cause a race condition with Claude Code. Use with caution."
     )
     
+    parser.add_argument(
+        "--io-workers",
+        type=positive_int,
+        default=DEFAULT_IO_WORKERS,
+        help=f"Number of threads used to scan directories and count lines (default: {DEFAULT_IO_WORKERS})"
+    )
+    
+    parser.add_argument(
+        "--select-all-matching",
+        metavar="GLOB",
+        help="Document every component directory whose relative path matches GLOB (e.g. 'pkg/*') instead of choosing a strategy interactively"
+    )
+    
     args = parser.parse_args()
     
     # Initialize and run
@@ -1177,7 +1532,9 @@ Examples:
         project_root=args.project_root,
         dry_run=args.dry_run,
         verbose=args.verbose,
-        max_workers=args.max_workers
+        max_workers=args.max_workers,
+        io_workers=args.io_workers,
+        select_pattern=args.select_all_matching
     )
     
     success = initializer.run()
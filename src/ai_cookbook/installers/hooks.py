@@ -2,14 +2,14 @@
 
 import json
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..installers.base import InteractiveInstaller, InstallationResult
 from ..utils.file_operations import (
     ensure_directory, copy_files, file_exists, directory_exists,
-    list_files, read_json_file, write_json_file
+    list_files, read_json_file, write_json_file_atomic, copy_executable
 )
 from ..utils.system import run_command
 from ..config.settings import CLAUDE_DIR, ORG_NAME
@@ -18,6 +18,9 @@ from ..updaters.detector import UpdateStatus
 # Get the project root directory (ai-cookbook)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 
+# Upper bound on hook dependency checks run at the same time
+MAX_DEPENDENCY_CHECKS = 8
+
 
 class HooksInstaller(InteractiveInstaller):
     """Installer for Claude Code hooks integration.
@@ -35,6 +38,13 @@ class HooksInstaller(InteractiveInstaller):
         self.hooks_source = PROJECT_ROOT / "claude-code" / "hooks"
         self.current_mode = "global"  # Default to global mode
         
+        # Parsed config.json per hook, keyed by path and tagged with its mtime
+        self._hook_config_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        # Installed hook names per settings file, keyed by what they were derived from
+        self._installed_hooks_cache: Dict[Path, Tuple[Tuple[int, int, Optional[int]], List[str]]] = {}
+        # Passing dependency check results per deps.sh, tagged with its mtime
+        self._dependency_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        
         # Initialize update detector for hooks in organization directory
         from ..config.settings import CLAUDE_HOOKS_DIR
         self.initialize_update_detector(self.hooks_source, CLAUDE_HOOKS_DIR)
@@ -93,12 +103,13 @@ class HooksInstaller(InteractiveInstaller):
             # Uninstall from both global and local
             for mode in ["global", "local"]:
                 installed_hooks = self._get_installed_hooks(mode)
-                for hook_name in installed_hooks:
-                    try:
-                        self.uninstall_hook(hook_name, mode)
+                if not installed_hooks:
+                    continue
+                for hook_name, result in self.uninstall_hooks(installed_hooks, mode):
+                    if result.success:
                         removed_hooks.append(f"{hook_name} ({mode})")
-                    except Exception as e:
-                        errors.append(f"Failed to uninstall {hook_name} ({mode}): {str(e)}")
+                    else:
+                        errors.append(f"Failed to uninstall {hook_name} ({mode}): {result.message}")
             
             if errors:
                 return InstallationResult(
@@ -200,12 +211,16 @@ class HooksInstaller(InteractiveInstaller):
                         hooks.append(hook_dir.name)
         return sorted(hooks)
         
-    def install_hook(self, hook_name: str, mode: Optional[str] = None) -> InstallationResult:
+    def install_hook(self, hook_name: str, mode: Optional[str] = None,
+                     settings: Optional[Dict[str, Any]] = None,
+                     dependencies: Optional[Dict[str, Any]] = None) -> InstallationResult:
         """Install a specific hook.
         
         Args:
             hook_name: Name of the hook to install
             mode: Installation mode ("global" or "local"), uses current_mode if not specified
+            settings: Settings to update in place instead of the settings file (used by install_hooks)
+            dependencies: Result of an earlier dependency check for this hook (used by install_hooks)
             
         Returns:
             InstallationResult indicating success/failure
@@ -232,7 +247,7 @@ class HooksInstaller(InteractiveInstaller):
                 )
                 
             # Check dependencies
-            deps_result = self._check_hook_dependencies(hook_name)
+            deps_result = dependencies or self._check_hook_dependencies(hook_name)
             if not deps_result['success']:
                 return InstallationResult(
                     False,
@@ -250,8 +265,7 @@ class HooksInstaller(InteractiveInstaller):
             
             # Copy hook script
             installed_hook_path = hooks_dir / f"{hook_name}.sh"
-            shutil.copy2(hook_script, installed_hook_path)
-            installed_hook_path.chmod(0o755)
+            copy_executable(hook_script, installed_hook_path)
             
             # Update metadata for the hook
             if ORG_NAME in str(hooks_dir):
@@ -273,7 +287,11 @@ class HooksInstaller(InteractiveInstaller):
             matcher = config.get('matcher', '')
             
             # Add hook to settings
-            self._add_hook_to_settings(hook_name, hook_type, matcher, str(installed_hook_path), mode)
+            if settings is None:
+                self._add_hook_to_settings(hook_name, hook_type, matcher, str(installed_hook_path), mode)
+            else:
+                self._apply_hook_to_settings(settings, hook_name, hook_type, matcher,
+                                             str(installed_hook_path), mode)
             
             # Register project if installing locally
             if mode == "local":
@@ -296,12 +314,14 @@ class HooksInstaller(InteractiveInstaller):
                 f"Failed to install hook {hook_name}: {str(e)}"
             )
             
-    def uninstall_hook(self, hook_name: str, mode: Optional[str] = None) -> InstallationResult:
+    def uninstall_hook(self, hook_name: str, mode: Optional[str] = None,
+                       settings: Optional[Dict[str, Any]] = None) -> InstallationResult:
         """Uninstall a specific hook.
         
         Args:
             hook_name: Name of the hook to uninstall
             mode: Installation mode ("global" or "local"), uses current_mode if not specified
+            settings: Settings to update in place instead of the settings file (used by uninstall_hooks)
             
         Returns:
             InstallationResult indicating success/failure
@@ -314,7 +334,10 @@ class HooksInstaller(InteractiveInstaller):
             installed_hook_path = hooks_dir / f"{hook_name}.sh"
             
             # Remove from settings
-            self._remove_hook_from_settings(hook_name, mode)
+            if settings is None:
+                self._remove_hook_from_settings(hook_name, mode)
+            else:
+                self._strip_hook_from_settings(settings, hook_name)
             
             # Remove hook script
             if installed_hook_path.exists():
@@ -331,7 +354,8 @@ class HooksInstaller(InteractiveInstaller):
                     self.update_detector.remove_metadata(hook_file_name)
             
             # Check if this was the last local hook and unregister project if so
-            if mode == "local":
+            # (batch uninstalls do this once the settings are written)
+            if mode == "local" and settings is None:
                 remaining_hooks = self._get_installed_hooks("local")
                 if not remaining_hooks:
                     self.project_registry.unregister_project(Path.cwd(), ['hooks'])
@@ -348,6 +372,78 @@ class HooksInstaller(InteractiveInstaller):
                 f"Failed to uninstall hook {hook_name}: {str(e)}"
             )
             
+    def install_hooks(self, hook_names: List[str], mode: Optional[str] = None) -> List[Tuple[str, InstallationResult]]:
+        """Install several hooks, reading and writing the settings file once.
+        
+        Args:
+            hook_names: Names of the hooks to install
+            mode: Installation mode ("global" or "local"), uses current_mode if not specified
+            
+        Returns:
+            List of (hook name, InstallationResult) pairs in the given order
+        """
+        if mode is None:
+            mode = self.current_mode
+            
+        settings_path = self._get_settings_path(mode)
+        try:
+            settings = self._load_settings(settings_path)
+        except Exception as e:
+            return [(hook_name, InstallationResult(False, f"Failed to install hook {hook_name}: {str(e)}"))
+                    for hook_name in hook_names]
+            
+        # Each check is a separate process, so run them side by side up front
+        dependencies = self._check_hooks_dependencies(hook_names)
+        results = [(hook_name, self.install_hook(hook_name, mode, settings=settings,
+                                                 dependencies=dependencies[hook_name]))
+                   for hook_name in hook_names]
+        
+        if any(result.success for _, result in results):
+            try:
+                self._write_settings(settings_path, settings)
+            except Exception as e:
+                return [(hook_name, InstallationResult(False, f"Failed to install hook {hook_name}: {str(e)}")
+                         if result.success else result)
+                        for hook_name, result in results]
+                
+        return results
+        
+    def uninstall_hooks(self, hook_names: List[str], mode: Optional[str] = None) -> List[Tuple[str, InstallationResult]]:
+        """Uninstall several hooks, reading and writing the settings file once.
+        
+        Args:
+            hook_names: Names of the hooks to uninstall
+            mode: Installation mode ("global" or "local"), uses current_mode if not specified
+            
+        Returns:
+            List of (hook name, InstallationResult) pairs in the given order
+        """
+        if mode is None:
+            mode = self.current_mode
+            
+        settings_path = self._get_settings_path(mode)
+        try:
+            settings = read_json_file(settings_path) if settings_path.exists() else None
+        except Exception as e:
+            return [(hook_name, InstallationResult(False, f"Failed to uninstall hook {hook_name}: {str(e)}"))
+                    for hook_name in hook_names]
+            
+        results = [(hook_name, self.uninstall_hook(hook_name, mode, settings=settings)) for hook_name in hook_names]
+        
+        if settings is not None and any(result.success for _, result in results):
+            try:
+                self._write_settings(settings_path, settings)
+            except Exception as e:
+                return [(hook_name, InstallationResult(False, f"Failed to uninstall hook {hook_name}: {str(e)}")
+                         if result.success else result)
+                        for hook_name, result in results]
+                
+        # Unregister the project once its last local hook is gone
+        if mode == "local" and not self._get_installed_hooks("local"):
+            self.project_registry.unregister_project(Path.cwd(), ['hooks'])
+            
+        return results
+        
     def set_mode(self, mode: str) -> None:
         """Set installation mode.
         
@@ -456,10 +552,7 @@ class HooksInstaller(InteractiveInstaller):
         available_hooks = status['available_hooks']
         uninstalled = [h for h in available_hooks if h not in installed_hooks]
         
-        results = []
-        for hook_name in uninstalled:
-            result = self.install_hook(hook_name)
-            results.append((hook_name, result))
+        results = self.install_hooks(uninstalled)
             
         successful = [h for h, r in results if r.success]
         failed = [h for h, r in results if not r.success]
@@ -481,10 +574,7 @@ class HooksInstaller(InteractiveInstaller):
         """Uninstall all hooks for current mode."""
         installed_hooks = self._get_installed_hooks(self.current_mode)
         
-        results = []
-        for hook_name in installed_hooks:
-            result = self.uninstall_hook(hook_name)
-            results.append((hook_name, result))
+        results = self.uninstall_hooks(installed_hooks)
             
         successful = [h for h, r in results if r.success]
         failed = [h for h, r in results if not r.success]
@@ -540,33 +630,47 @@ class HooksInstaller(InteractiveInstaller):
             List of installed hook names
         """
         settings_path = self._get_settings_path(mode)
-        if not settings_path.exists():
+        hooks_dir = self._get_hooks_dir(mode)
+        try:
+            settings_stat = settings_path.stat()
+        except OSError:
             return []
+        try:
+            hooks_dir_mtime = hooks_dir.stat().st_mtime_ns
+        except OSError:
+            hooks_dir_mtime = None
+            
+        # Editing settings or adding/removing hook scripts changes the key
+        cache_key = (settings_stat.st_mtime_ns, settings_stat.st_size, hooks_dir_mtime)
+        cached = self._installed_hooks_cache.get(settings_path)
+        if cached is not None and cached[0] == cache_key:
+            return list(cached[1])
             
         try:
             settings = read_json_file(settings_path)
             hooks = []
             
             if 'hooks' in settings:
-                hooks_dir = self._get_hooks_dir(mode)
                 for hook_type, entries in settings['hooks'].items():
                     for entry in entries:
                         for hook in entry.get('hooks', []):
                             command = hook.get('command', '')
                             # Extract hook name from command path
                             if command.endswith('.sh'):
-                                hook_name = Path(command).stem
+                                hook_name = os.path.basename(command)[:-3]
                                 hook_file = hooks_dir / f"{hook_name}.sh"
                                 
                                 # Only include if file actually exists
                                 if hook_file.exists() and hook_name not in hooks:
                                     hooks.append(hook_name)
                                     
-            return sorted(hooks)
-            
         except Exception:
             return []
             
+        hooks.sort()
+        self._installed_hooks_cache[settings_path] = (cache_key, hooks)
+        return list(hooks)
+            
     def _get_hook_info(self, hook_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific hook.
         
@@ -577,12 +681,22 @@ class HooksInstaller(InteractiveInstaller):
             Dictionary with hook information or None if not found
         """
         config_file = self.hooks_source / hook_name / "config.json"
-        if config_file.exists():
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+            
+        # Menus ask for this on every redraw, only re-parse when the file changes
+        cached = self._hook_config_cache.get(config_file)
+        if cached is None or cached[0] != mtime_ns:
             try:
-                return read_json_file(config_file)
+                cached = (mtime_ns, read_json_file(config_file))
             except Exception:
-                pass
-        return None
+                return None
+            self._hook_config_cache[config_file] = cached
+            
+        # Callers annotate the result, so hand out a copy
+        return dict(cached[1])
         
     def check_updates(self) -> Optional[UpdateStatus]:
         """Check for updates to hooks in all locations.
@@ -736,8 +850,7 @@ class HooksInstaller(InteractiveInstaller):
                 dest_file = local_hooks_dir / hook_file
                 
                 if source_file.exists():
-                    shutil.copy2(source_file, dest_file)
-                    dest_file.chmod(0o755)
+                    copy_executable(source_file, dest_file)
                     detector.update_metadata(hook_file, source_file)
                     updated_count += 1
             except Exception as e:
@@ -864,7 +977,7 @@ class HooksInstaller(InteractiveInstaller):
                 
                 # Save modified settings
                 if modified:
-                    write_json_file(settings_path, settings)
+                    self._write_settings(settings_path, settings)
                 
                 # Check for orphaned files (files without settings entries)
                 if hooks_dir.exists():
@@ -1006,22 +1119,54 @@ class HooksInstaller(InteractiveInstaller):
             Dictionary with success status and details
         """
         deps_script = self.hooks_source / hook_name / "deps.sh"
-        if deps_script.exists():
+        try:
+            mtime_ns = deps_script.stat().st_mtime_ns
+        except OSError:
+            return {'success': True, 'output': 'No dependencies to check'}
+            
+        cached = self._dependency_cache.get(deps_script)
+        if cached is not None and cached[0] == mtime_ns:
+            return dict(cached[1])
+            
+        try:
             try:
-                result = run_command(["bash", str(deps_script)], check=False)
-                return {
-                    'success': result.returncode == 0,
-                    'output': (result.stdout or '') + (result.stderr or ''),
-                    'return_code': result.returncode
-                }
-            except Exception as e:
-                return {
-                    'success': False,
-                    'output': f'Error running dependencies check: {str(e)}',
-                    'return_code': -1
-                }
-        return {'success': True, 'output': 'No dependencies to check'}
+                # Run it directly so its shebang picks the interpreter
+                result = run_command([str(deps_script)], check=False, close_fds=False)
+            except OSError:
+                # Not executable or no shebang, have bash interpret it
+                result = run_command(["bash", str(deps_script)], check=False, close_fds=False)
+            deps_result = {
+                'success': result.returncode == 0,
+                'output': (result.stdout or '') + (result.stderr or ''),
+                'return_code': result.returncode
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'output': f'Error running dependencies check: {str(e)}',
+                'return_code': -1
+            }
+            
+        # Failures aren't kept, so installing a missing tool takes effect on the next try
+        if deps_result['success']:
+            self._dependency_cache[deps_script] = (mtime_ns, deps_result)
+        return dict(deps_result)
+        
+    def _check_hooks_dependencies(self, hook_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Check the dependencies of several hooks concurrently.
         
+        Args:
+            hook_names: Names of the hooks
+            
+        Returns:
+            Dictionary mapping each hook name to its _check_hook_dependencies result
+        """
+        if not hook_names:
+            return {}
+            
+        with ThreadPoolExecutor(max_workers=min(MAX_DEPENDENCY_CHECKS, len(hook_names))) as executor:
+            return dict(zip(hook_names, executor.map(self._check_hook_dependencies, hook_names)))
+            
     def _add_hook_to_settings(self, hook_name: str, hook_type: str, matcher: str, 
                              command_path: str, mode: str) -> None:
         """Add hook to settings.json.
@@ -1034,14 +1179,24 @@ class HooksInstaller(InteractiveInstaller):
             mode: Installation mode ("global" or "local")
         """
         settings_path = self._get_settings_path(mode)
+        settings = self._load_settings(settings_path)
+        self._apply_hook_to_settings(settings, hook_name, hook_type, matcher, command_path, mode)
         
-        # Initialize settings file if needed
-        if not settings_path.exists():
-            settings = {"hooks": {}}
-            write_json_file(settings_path, settings)
-        else:
-            settings = read_json_file(settings_path)
-            
+        # Write updated settings
+        self._write_settings(settings_path, settings)
+        
+    def _apply_hook_to_settings(self, settings: Dict[str, Any], hook_name: str, hook_type: str,
+                                matcher: str, command_path: str, mode: str) -> None:
+        """Add a hook entry to loaded settings, replacing any existing entry for it.
+        
+        Args:
+            settings: Settings data to update in place
+            hook_name: Name of the hook
+            hook_type: Type of hook (e.g., "PostToolUse")
+            matcher: Matcher pattern for the hook
+            command_path: Path to the hook command
+            mode: Installation mode ("global" or "local")
+        """
         # Ensure hooks structure exists
         if 'hooks' not in settings:
             settings['hooks'] = {}
@@ -1049,9 +1204,10 @@ class HooksInstaller(InteractiveInstaller):
             settings['hooks'][hook_type] = []
             
         # Remove existing entry for this hook
+        script_name = f"{hook_name}.sh"
         settings['hooks'][hook_type] = [
             entry for entry in settings['hooks'][hook_type]
-            if not any(hook_name in h.get('command', '') for h in entry.get('hooks', []))
+            if not any(os.path.basename(h.get('command', '')) == script_name for h in entry.get('hooks', []))
         ]
         
         # Use relative path for local installations
@@ -1072,8 +1228,28 @@ class HooksInstaller(InteractiveInstaller):
         }
         settings['hooks'][hook_type].append(new_entry)
         
-        # Write updated settings
-        write_json_file(settings_path, settings)
+    def _load_settings(self, settings_path: Path) -> Dict[str, Any]:
+        """Read a settings file, starting from an empty hooks section if it doesn't exist.
+        
+        Args:
+            settings_path: Path to the settings file
+            
+        Returns:
+            Settings data
+        """
+        if not settings_path.exists():
+            return {"hooks": {}}
+        return read_json_file(settings_path)
+        
+    def _write_settings(self, settings_path: Path, settings: Dict[str, Any]) -> None:
+        """Write a settings file and drop the installed hooks cached for it.
+        
+        Args:
+            settings_path: Path to the settings file
+            settings: Settings data to write
+        """
+        write_json_file_atomic(settings_path, settings)
+        self._installed_hooks_cache.pop(settings_path, None)
         
     def _remove_hook_from_settings(self, hook_name: str, mode: str) -> None:
         """Remove hook from settings.json.
@@ -1087,16 +1263,25 @@ class HooksInstaller(InteractiveInstaller):
             return
             
         settings = read_json_file(settings_path)
+        self._strip_hook_from_settings(settings, hook_name)
+            
+        # Write updated settings
+        self._write_settings(settings_path, settings)
         
+    def _strip_hook_from_settings(self, settings: Dict[str, Any], hook_name: str) -> None:
+        """Remove a hook's entries from loaded settings.
+        
+        Args:
+            settings: Settings data to update in place
+            hook_name: Name of the hook
+        """
         if 'hooks' in settings:
+            script_name = f"{hook_name}.sh"
             for hook_type, entries in settings['hooks'].items():
                 settings['hooks'][hook_type] = [
                     entry for entry in entries
-                    if not any(hook_name in h.get('command', '') for h in entry.get('hooks', []))
+                    if not any(os.path.basename(h.get('command', '')) == script_name for h in entry.get('hooks', []))
                 ]
                 
             # Remove empty hook type arrays
-            settings['hooks'] = {k: v for k, v in settings['hooks'].items() if v}
-            
-        # Write updated settings
-        write_json_file(settings_path, settings)
\ No newline at end of file
+            settings['hooks'] = {k: v for k, v in settings['hooks'].items() if v}
\ No newline at end of file
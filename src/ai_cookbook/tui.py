@@ -3,14 +3,19 @@
 Terminal UI for ai-cookbook - separate from click
 """
 
+import io
 import os
+import re
 import sys
+import shutil
 import termios
 import tty
 import select
 import signal
+import unicodedata
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Tuple
 
 from .config.settings import ORG_NAME, ORG_DISPLAY_NAME, VERSION
 from .installers.commands import CommandsInstaller
@@ -43,6 +48,18 @@ class Colors:
 
 # Global state
 terminal_resized = False
+# Lines of the menu frame currently on screen, emptied whenever the screen is cleared
+drawn_frame: List[str] = []
+# Whether stdin is held in cbreak mode by cbreak_input(), and input read past the last key
+cbreak_active = False
+pending_input = ''
+
+# Main menu lines per installer as (unselected, selected), see get_menu_item_line
+menu_item_lines: Dict[str, Tuple[str, str]] = {}
+
+ARROW_KEYS = {'\x1b[A': 'UP', '\x1b[B': 'DOWN', '\x1b[C': 'RIGHT', '\x1b[D': 'LEFT'}
+
+ANSI_ESCAPE = re.compile(r'\033\[[0-9;?]*[A-Za-z]')
 
 def signal_handler(signum: int, frame: Any) -> None:
     """Handle terminal resize"""
@@ -52,8 +69,37 @@ def signal_handler(signum: int, frame: Any) -> None:
 # Set up signal handler for terminal resize
 signal.signal(signal.SIGWINCH, signal_handler)
 
+def read_key(timeout=None):
+    """Read a single key from stdin, which must already be in cbreak mode"""
+    global pending_input
+    
+    if not pending_input:
+        if timeout is not None:
+            # Use select to implement timeout
+            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            if not ready:
+                return None
+        
+        # One unbuffered read picks up a whole escape sequence at once
+        data = os.read(sys.stdin.fileno(), 32)
+        if not data:
+            return ''
+        pending_input = data.decode('utf-8', errors='ignore')
+    
+    # Handle arrow keys, anything after the first key is kept for the next call
+    for sequence, key in ARROW_KEYS.items():
+        if pending_input.startswith(sequence):
+            pending_input = pending_input[len(sequence):]
+            return key
+    
+    ch, pending_input = pending_input[:1], pending_input[1:]
+    return ch
+
 def getch(timeout=None):
     """Get a single character from stdin with optional timeout"""
+    if cbreak_active:
+        return read_key(timeout)
+    
     try:
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
@@ -70,36 +116,75 @@ def getch(timeout=None):
         else:
             tty.setcbreak(fd)
         
-        if timeout is not None:
-            # Use select to implement timeout
-            ready, _, _ = select.select([sys.stdin], [], [], timeout)
-            if not ready:
-                return None
-        
-        ch = sys.stdin.read(1)
-        
-        # Handle arrow keys and special characters
-        if ch == '\x1b':  # ESC sequence
-            ch2 = sys.stdin.read(1)
-            if ch2 == '[':
-                ch3 = sys.stdin.read(1)
-                if ch3 == 'A':
-                    return 'UP'
-                elif ch3 == 'B':
-                    return 'DOWN'
-                elif ch3 == 'C':
-                    return 'RIGHT'
-                elif ch3 == 'D':
-                    return 'LEFT'
-        
-        return ch
+        return read_key(timeout)
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
+@contextmanager
+def cbreak_input():
+    """Hold stdin in cbreak mode so getch doesn't switch modes on every call"""
+    global cbreak_active
+    
+    try:
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+    except (OSError, termios.error):
+        # Not a real terminal, getch falls back on its own
+        yield
+        return
+    
+    if cbreak_active:
+        yield
+        return
+    
+    tty.setcbreak(fd)
+    cbreak_active = True
+    try:
+        yield
+    finally:
+        cbreak_active = False
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
 def clear_screen() -> None:
     """Clear the terminal screen"""
+    drawn_frame.clear()
     print("\033[2J\033[H", end='')
 
+def display_width(text: str) -> int:
+    """Number of terminal columns a line occupies, ignoring color codes"""
+    plain = ANSI_ESCAPE.sub('', text)
+    return sum(2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1 for ch in plain)
+
+def present_frame(frame: str) -> None:
+    """Show a menu frame, rewriting only the lines that differ from what is on screen"""
+    lines = frame.split('\n')
+    size = shutil.get_terminal_size()
+    
+    if len(lines) >= size.lines or any(display_width(line) >= size.columns for line in lines):
+        # Wrapped or scrolled lines can't be addressed by row, repaint everything
+        sys.stdout.write(f"{Colors.HIDE_CURSOR}\033[2J\033[H{frame}")
+        drawn_frame.clear()
+    else:
+        parts = [Colors.HIDE_CURSOR]
+        last_row = len(lines) - 1
+        for row, line in enumerate(lines):
+            # The last line is always written so the cursor ends up after the frame
+            if row == last_row or row >= len(drawn_frame) or drawn_frame[row] != line:
+                parts.append(f"\033[{row + 1};1H{Colors.CLEAR_LINE}{line}")
+        # Drop whatever is left below, e.g. a longer previous frame or an error message
+        parts.append("\033[J")
+        sys.stdout.write(''.join(parts))
+        drawn_frame[:] = lines
+    sys.stdout.flush()
+
+@contextmanager
+def menu_frame():
+    """Collect everything a menu prints and present it as a single frame"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        yield
+    present_frame(buffer.getvalue())
+
 def get_installers() -> Dict[str, Any]:
     """Get all installer instances"""
     return {
@@ -136,9 +221,6 @@ def draw_base_menu(
         show_details: Whether to show details for selected item
         detail_func: Optional function to display item details
     """
-    print(Colors.HIDE_CURSOR, end='')
-    clear_screen()
-    
     # Header
     print(f"\n{Colors.BOLD}{Colors.CYAN}🐼 {title}{Colors.NC}")
     
@@ -165,13 +247,26 @@ def draw_base_menu(
         else:
             print(f"  {display} {status}")
 
+def get_menu_item_line(name: str, installer: Any, is_selected: bool) -> str:
+    """Get the rendered main menu line for an installer, building it once per session"""
+    lines = menu_item_lines.get(name)
+    if lines is None:
+        if name == 'recommended':
+            lines = (f" 🎯 {installer.name:<80}",
+                     f" 🎯 {Colors.REVERSE}{installer.name:<80}{Colors.NC}")
+        elif name == 'uninstall':
+            lines = (f" {Colors.RED}🗑  {installer.name:<77}{Colors.NC}",
+                     f" {Colors.REVERSE}🗑  {installer.name:<77}{Colors.NC}")
+        else:
+            # Regular tools
+            lines = (f"   {installer.name:<80}",
+                     f"   {Colors.REVERSE}{installer.name:<80}{Colors.NC}")
+        menu_item_lines[name] = lines
+    return lines[is_selected]
+
+@menu_frame()
 def draw_menu(installer_names: List[str], selected: int, installers: Dict[str, Any], show_details: bool = False) -> None:
     """Draw the interactive menu"""
-    print(Colors.HIDE_CURSOR, end='')
-    
-    # Clear screen and reset cursor
-    clear_screen()
-    
     # Header
     print(f"\n{Colors.BOLD}{Colors.CYAN}🐼 {ORG_DISPLAY_NAME} AI Cookbook Installer{Colors.NC}")
     print(f"Version: {Colors.GREEN}v{VERSION}{Colors.NC}\n")
@@ -198,56 +293,41 @@ def draw_menu(installer_names: List[str], selected: int, installers: Dict[str, A
             print(f"{Colors.DIM}Complete removal options{Colors.NC}")
         
         # Draw the menu item
-        if name == 'recommended':
-            if is_selected:
-                print(f" 🎯 {Colors.REVERSE}{installer.name:<80}{Colors.NC}")
-            else:
-                print(f" 🎯 {installer.name:<80}")
-        elif name == 'uninstall':
-            if is_selected:
-                print(f" {Colors.REVERSE}🗑  {installer.name:<77}{Colors.NC}")
-            else:
-                print(f" {Colors.RED}🗑  {installer.name:<77}{Colors.NC}")
-        else:
-            # Regular tools
-            if is_selected:
-                print(f"   {Colors.REVERSE}{installer.name:<80}{Colors.NC}")
-                
-                if show_details:
-                    # Show additional details for selected component
-                    details = installer.get_details()
-                    print(f"\n{Colors.DIM}     Description: {Colors.NC}{installer.description}")
-                    
-                    # Show component-specific details
-                    if name == 'commands' and 'installed_commands' in details:
-                        count = len(details['installed_commands'])
-                        print(f"{Colors.DIM}     Commands: {Colors.NC}{count} installed")
-                    elif name == 'code-standards' and 'installed_languages' in details:
-                        langs = details['installed_languages']
-                        if langs:
-                            print(f"{Colors.DIM}     Languages: {Colors.NC}{', '.join(langs)}")
-                    elif name == 'hooks':
-                        if 'global_hooks' in details and 'local_hooks' in details:
-                            global_count = len(details['global_hooks'])
-                            local_count = len(details['local_hooks'])
-                            print(f"{Colors.DIM}     Hooks: {Colors.NC}{global_count} global, {local_count} local")
-                    elif name == 'skills':
-                        status = details.get('status', {})
-                        installed_skills = status.get('installed_skills', [])
-                        available_skills = status.get('available_skills', [])
-                        print(f"{Colors.DIM}     Skills: {Colors.NC}{len(installed_skills)} installed, {len(available_skills)} available")
-                    elif name == 'agents':
-                        status = details.get('status', {})
-                        installed_agents = status.get('installed_agents', [])
-                        available_agents = status.get('available_agents', [])
-                        print(f"{Colors.DIM}     Agents: {Colors.NC}{len(installed_agents)} installed, {len(available_agents)} available")
-                    elif name == 'scripts' and 'available_scripts' in details:
-                        count = len(details['available_scripts'])
-                        print(f"{Colors.DIM}     Scripts: {Colors.NC}{count} available")
-                    
-                    print()
-            else:
-                print(f"   {installer.name:<80}")
+        print(get_menu_item_line(name, installer, is_selected))
+        
+        if is_selected and show_details and name not in ('recommended', 'uninstall'):
+            # Show additional details for selected component
+            details = installer.get_details()
+            print(f"\n{Colors.DIM}     Description: {Colors.NC}{installer.description}")
+            
+            # Show component-specific details
+            if name == 'commands' and 'installed_commands' in details:
+                count = len(details['installed_commands'])
+                print(f"{Colors.DIM}     Commands: {Colors.NC}{count} installed")
+            elif name == 'code-standards' and 'installed_languages' in details:
+                langs = details['installed_languages']
+                if langs:
+                    print(f"{Colors.DIM}     Languages: {Colors.NC}{', '.join(langs)}")
+            elif name == 'hooks':
+                if 'global_hooks' in details and 'local_hooks' in details:
+                    global_count = len(details['global_hooks'])
+                    local_count = len(details['local_hooks'])
+                    print(f"{Colors.DIM}     Hooks: {Colors.NC}{global_count} global, {local_count} local")
+            elif name == 'skills':
+                status = details.get('status', {})
+                installed_skills = status.get('installed_skills', [])
+                available_skills = status.get('available_skills', [])
+                print(f"{Colors.DIM}     Skills: {Colors.NC}{len(installed_skills)} installed, {len(available_skills)} available")
+            elif name == 'agents':
+                status = details.get('status', {})
+                installed_agents = status.get('installed_agents', [])
+                available_agents = status.get('available_agents', [])
+                print(f"{Colors.DIM}     Agents: {Colors.NC}{len(installed_agents)} installed, {len(available_agents)} available")
+            elif name == 'scripts' and 'available_scripts' in details:
+                count = len(details['available_scripts'])
+                print(f"{Colors.DIM}     Scripts: {Colors.NC}{count} available")
+            
+            print()
     
     # Current item description
     current_installer = installers[installer_names[selected]]
@@ -437,7 +517,9 @@ def run_component_menu(component_name: str, installer: Any) -> None:
     
     try:
         if component_name == 'hooks':
-            run_hooks_menu(installer)
+            # Nothing in the hooks menu reads lines, so keep the terminal in cbreak throughout
+            with cbreak_input():
+                run_hooks_menu(installer)
         elif component_name == 'commands':
             run_commands_menu(installer)
         elif component_name == 'skills':
@@ -464,6 +546,8 @@ def run_component_menu(component_name: str, installer: Any) -> None:
     except Exception as e:
         # Show error inline without clearing
         print(f"\n{Colors.RED}Error: {e}{Colors.NC}")
+        # The screen no longer matches the last frame, so the next menu repaints in full
+        drawn_frame.clear()
 
 def run_hooks_menu(installer: Any) -> None:
     """Run hooks component submenu with individual hook management"""
@@ -545,27 +629,23 @@ def run_hooks_menu(installer: Any) -> None:
                         print(f"{Colors.DIM}Details: {result.details}{Colors.NC}")
                     print(f"\n{Colors.DIM}Press any key to continue...{Colors.NC}")
                     getch()
+                    # The message may have scrolled the menu out of place
+                    clear_screen()
                 
                 force_redraw = True
             elif key == 'a':  # Install all
-                results = []
                 details = installer.get_details()
                 installed_hooks = details.get(f'{mode}_hooks', [])
                 
-                for hook in available_hooks:
-                    if hook not in installed_hooks:
-                        result = installer.install_hook(hook, mode)
-                        results.append((hook, result))
+                uninstalled = [hook for hook in available_hooks if hook not in installed_hooks]
+                results = installer.install_hooks(uninstalled, mode)
                 
                 force_redraw = True
             elif key == 'r':  # Remove all
-                results = []
                 details = installer.get_details()
                 installed_hooks = details.get(f'{mode}_hooks', [])
                 
-                for hook in installed_hooks:
-                    result = installer.uninstall_hook(hook, mode)
-                    results.append((hook, result))
+                results = installer.uninstall_hooks(installed_hooks, mode)
                 
                 force_redraw = True
     except KeyboardInterrupt:
@@ -574,6 +654,7 @@ def run_hooks_menu(installer: Any) -> None:
         print(Colors.SHOW_CURSOR)
 
 
+@menu_frame()
 def draw_hooks_menu(hooks: List[str], selected: int, installer: Any, show_details: bool = False, mode: str = "global") -> None:
     """Draw the hooks submenu"""
     # Get current installation status
@@ -765,6 +846,7 @@ def run_commands_menu(installer: Any) -> None:
     finally:
         print(Colors.SHOW_CURSOR)
 
+@menu_frame()
 def draw_commands_menu(commands: List[str], selected: int, installer: Any, show_details: bool = False) -> None:
     """Draw the commands submenu"""
     # Get current installation status
@@ -913,6 +995,7 @@ def run_code_standards_menu(installer: Any) -> None:
     finally:
         print(Colors.SHOW_CURSOR)
 
+@menu_frame()
 def draw_code_standards_menu(languages: List[str], selected: int, installer: Any, show_details: bool = False) -> None:
     """Draw the code standards submenu"""
     # Get current installation status
@@ -1059,9 +1142,12 @@ def run_agents_menu(installer: Any) -> None:
         print(f"\n{Colors.RED}Error in agents menu: {e}{Colors.NC}")
         print(f"\n{Colors.DIM}Press any key to continue...{Colors.NC}")
         getch()
+        # The message may have scrolled the menu out of place
+        clear_screen()
     finally:
         print(Colors.SHOW_CURSOR)
 
+@menu_frame()
 def draw_agents_menu(agents: List[str], selected: int, installer: Any, show_details: bool = False) -> None:
     """Draw the agents submenu"""
     # Get current installation status
@@ -1216,10 +1302,13 @@ def run_skills_menu(installer: Any) -> None:
         print(f"\n{Colors.RED}Error in skills menu: {e}{Colors.NC}")
         print(f"\n{Colors.DIM}Press any key to continue...{Colors.NC}")
         getch()
+        # The message may have scrolled the menu out of place
+        clear_screen()
     finally:
         print(Colors.SHOW_CURSOR)
 
 
+@menu_frame()
 def draw_skills_menu(skills: List[str], selected: int, installer: Any, show_details: bool = False) -> None:
     """Draw the skills submenu"""
     # Get current installation status
@@ -22,7 +22,12 @@ class InteractiveUpdateUI:
         
     def _clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            # Write the escape sequence ourselves instead of spawning clear
+            sys.stdout.write('\033[2J\033[H')
+            sys.stdout.flush()
     
     def _get_input_char(self) -> str:
         """Get a single character input from user."""
@@ -93,6 +93,35 @@ def write_json_file(path: Path, data: Dict[str, Any], indent: int = 2) -> None:
         json.dump(data, f, indent=indent, ensure_ascii=False)
 
 
+def write_json_file_atomic(path: Path, data: Dict[str, Any], indent: int = 2) -> None:
+    """Write data to JSON file without ever leaving it half written.
+    
+    The data is written and synced to a temporary file next to the target,
+    which then replaces it in one rename. If the path is a symlink, the file
+    it points to is replaced, and an existing file keeps its permissions.
+    
+    Args:
+        path: Path to JSON file
+        data: Data to write
+        indent: Number of spaces for indentation
+    """
+    target = path.resolve()
+    ensure_directory(target.parent)
+    
+    tmp_path = target.with_name(target.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def remove_directory(path: Path) -> None:
     """Remove directory and all its contents.
     
@@ -169,6 +198,21 @@ def make_executable(path: Path) -> None:
         path.chmod(current_mode | 0o100)
 
 
+def copy_executable(source: Path, dest: Path, mode: int = 0o755) -> None:
+    """Copy a file's contents and give the copy an executable mode.
+    
+    Unlike shutil.copy2 no timestamps or other metadata are carried over,
+    and on Linux the contents are copied in the kernel with sendfile.
+    
+    Args:
+        source: File to copy
+        dest: Destination file path
+        mode: Permission bits for the copy
+    """
+    shutil.copyfile(source, dest)
+    os.chmod(dest, mode)
+
+
 def read_text_file(path: Path, encoding: str = 'utf-8') -> str:
     """Read text file contents.
     
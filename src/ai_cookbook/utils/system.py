@@ -130,7 +130,8 @@ def is_in_path(directory: Path) -> bool:
 
 
 def run_command(command: List[str], cwd: Optional[Path] = None, 
-                capture_output: bool = True, check: bool = True) -> subprocess.CompletedProcess:
+                capture_output: bool = True, check: bool = True,
+                close_fds: bool = True) -> subprocess.CompletedProcess:
     """Run shell command and return result.
     
     Args:
@@ -138,6 +139,9 @@ def run_command(command: List[str], cwd: Optional[Path] = None,
         cwd: Working directory for command
         capture_output: Whether to capture stdout/stderr
         check: Whether to raise exception on non-zero exit code
+        close_fds: Whether to close inherited file descriptors in the child.
+                  Python's own descriptors are non-inheritable, and passing False
+                  lets subprocess use posix_spawn for commands given by path
         
     Returns:
         CompletedProcess instance with command result
@@ -150,7 +154,8 @@ def run_command(command: List[str], cwd: Optional[Path] = None,
         cwd=cwd,
         capture_output=capture_output,
         text=True,
-        check=check
+        check=check,
+        close_fds=close_fds
     )
 
 